@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Sports Score Display
+
+    python3 benchmark.py parse [payload.json ...]
+    python3 benchmark.py memory [payload.json ...]
+    python3 benchmark.py priority [payload.json ...]
+    python3 benchmark.py render [payload.json ...]
+
+With no payload files a synthetic Saturday college football slate is used.
+It follows the shape of ESPN's college football scoreboard, but no recorded
+payloads ship with the repo, so its numbers are only a guide. Record real
+payloads to compare against, for example:
+
+    curl -o ncaaf.json "http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?groups=80&limit=300"
+"""
+
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from config import (FONT_LARGE, FONT_SMALL, PRIORITY_TEAM_PATTERNS, PRIORITY_TEAMS,
+                    TICKER_FONT_LARGE_SIZE, TICKER_FONT_SMALL_SIZE)
+from game_store import make_game
+from priority import PriorityMatcher
+from scoreboard import PARSE_MODES, decode_scoreboard, ijson
+from synthetic import synthetic_scoreboard
+
+def load_payload(path, events):
+    """Raw body of a recorded payload, or a synthetic slate for '-'"""
+    if path == '-':
+        return json.dumps(synthetic_scoreboard(events)).encode()
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def parse_child(path, mode, repeats, events):
+    """Measure one decode mode in a fresh process so peak RSS is not shared"""
+    body = load_payload(path, events)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        data = decode_scoreboard(body, mode)
+        times.append(time.perf_counter() - start)
+        del data
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    data = decode_scoreboard(body, mode)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'events': len(data.get('events', [])),
+        'best_ms': min(times) * 1000,
+        'mean_ms': sum(times) / len(times) * 1000,
+        'rss_growth_kb': rss_after - rss_before,
+        'traced_peak_kb': traced_peak / 1024,
+    }))
+
+
+def game_dict(event, league_name, league_key):
+    """A game in the old 12-key dict layout, for comparison"""
+    away, home = event['competitions'][0]['competitors'][:2]
+    status = event['status']['type']
+    return {
+        'id': event['id'], 'league': league_name, 'league_key': league_key,
+        'away_team': away['team']['abbreviation'][:4], 'home_team': home['team']['abbreviation'][:4],
+        'away_score': away.get('score', '0'), 'home_score': home.get('score', '0'),
+        'status': status['shortDetail'], 'state': status['state'], 'is_priority': False,
+        'away_full_name': away['team']['displayName'], 'home_full_name': home['team']['displayName'],
+    }
+
+
+def game_record(event, league_name, league_key):
+    """A game as a Game record"""
+    away, home = event['competitions'][0]['competitors'][:2]
+    status = event['status']['type']
+    return make_game(event['id'], league_name, league_key, away, home,
+                     status['shortDetail'], status['state'], False)
+
+
+def measure_refreshes(events, build, refreshes):
+    """Memory kept by one slate of games, plus allocations and GC runs while rebuilding it"""
+    # Copy the strings the way a fresh decode would, so interning has work to do
+    payloads = [json.loads(json.dumps(events)) for _ in range(refreshes)]
+
+    gc.collect()
+    collections_before = sum(stat['collections'] for stat in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    games = None
+    for payload in payloads:
+        games = [build(event, 'NCAAF', 'college-football') for event in payload]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    payloads = None
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = sum(stat['collections'] for stat in gc.get_stats()) - collections_before
+    return len(games), retained, elapsed, collections
+
+
+def bench_memory(args):
+    """Compare per-game dicts with Game records over a full slate"""
+    for path in args.payloads or ['-']:
+        data = decode_scoreboard(load_payload(path, args.events), 'selective')
+        name = path if path != '-' else f'synthetic ({args.events} events)'
+        print(f"{name}, {args.refreshes} refreshes")
+        print(f"  {'layout':<8} {'games':>6} {'kept KB':>9} {'B/game':>8} {'build ms':>9} {'GC runs':>8}")
+        for layout, build in (('dict', game_dict), ('Game', game_record)):
+            count, retained, elapsed, collections = measure_refreshes(data['events'], build,
+                                                                      args.refreshes)
+            print(f"  {layout:<8} {count:>6} {retained / 1024:>9.1f} {retained / max(count, 1):>8.0f} "
+                  f"{elapsed * 1000 / args.refreshes:>9.2f} {collections:>8}")
+
+
+def substring_is_priority(team_name, league):
+    """The old matcher: substring scan of every configured name"""
+    if league not in PRIORITY_TEAMS:
+        return False
+    for priority in PRIORITY_TEAMS[league]:
+        if priority.lower() in team_name.lower():
+            return True
+    return False
+
+
+def bench_priority(args):
+    """Compare substring matching with PriorityMatcher over a slate"""
+    league = args.league
+    for path in args.payloads or ['-']:
+        data = decode_scoreboard(load_payload(path, args.events), 'selective')
+        teams = [competitor.get('team', {}) for event in data['events']
+                 for competitor in event['competitions'][0]['competitors'][:2]]
+        name = path if path != '-' else f'synthetic ({args.events} events)'
+        print(f"{name}: {len(teams)} competitors, league {league}, {args.refreshes} refreshes")
+
+        start = time.perf_counter()
+        for _ in range(args.refreshes):
+            old = [substring_is_priority(team.get('displayName', ''), league) for team in teams]
+        substring_time = time.perf_counter() - start
+
+        matcher = PriorityMatcher(PRIORITY_TEAMS, PRIORITY_TEAM_PATTERNS)
+        start = time.perf_counter()
+        new = [matcher.matches(league, team) for team in teams]
+        cold_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.refreshes):
+            new = [matcher.matches(league, team) for team in teams]
+        warm_time = time.perf_counter() - start
+
+        print(f"  {'matcher':<16} {'matches':>7} {'us/refresh':>11}")
+        print(f"  {'substring':<16} {sum(old):>7} {substring_time * 1e6 / args.refreshes:>11.1f}")
+        print(f"  {'compiled (cold)':<16} {sum(new):>7} {cold_time * 1e6:>11.1f}")
+        print(f"  {'compiled (warm)':<16} {sum(new):>7} {warm_time * 1e6 / args.refreshes:>11.1f}")
+        false_positives = sorted({team.get('displayName') for team, a, b in zip(teams, old, new) if a and not b})
+        if false_positives:
+            print(f"  only matched by substring: {', '.join(false_positives)}")
+
+
+def run_frames(draw, frames):
+    """Per-frame latencies, then peak traced memory and net allocated blocks per frame"""
+    latencies = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        draw(frame)
+        latencies.append(time.perf_counter() - start)
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for frame in range(frames):
+        draw(frames + frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    blocks = (sys.getallocatedblocks() - blocks_before) / frames
+    return latencies, peak - baseline, blocks
+
+
+def render_scenarios(display, games):
+    """(name, draw(frame)) pairs covering each way a frame gets drawn"""
+    rotation = games[:max(1, display.frame_cache.size // 2)]
+
+    def cold(frame):
+        display.draw_game(games[frame % len(games)])
+
+    def warm(frame):
+        display.draw_game(rotation[frame % len(rotation)])
+
+    def score_change(frame):
+        game = rotation[frame % len(rotation)]
+        display.draw_game(game._replace(home_score=game.home_score + frame))
+
+    pages = display.pages(games)
+    page_rotation = pages[:max(1, display.frame_cache.size // 2)]
+
+    def page_cold(frame):
+        display.draw_games(pages[frame % len(pages)])
+
+    def page_warm(frame):
+        display.draw_games(page_rotation[frame % len(page_rotation)])
+
+    def page_score(frame):
+        page = list(page_rotation[frame % len(page_rotation)])
+        page[0] = page[0]._replace(home_score=page[0].home_score + frame)
+        display.draw_games(page)
+
+    def no_games(frame):
+        display.draw_no_games()
+
+    scenarios = [('draw_game cold', cold), ('draw_game cached', warm),
+                 ('draw_game score', score_change), ('draw_games cold', page_cold),
+                 ('draw_games cached', page_warm), ('draw_games score', page_score),
+                 ('draw_no_games', no_games)]
+    if display.ticker is None:
+        return scenarios
+
+    from sports_display import GameSnapshot
+    priority = [game._replace(is_priority=True) for game in games[:1]]
+    others = list(games[1:])
+    snapshot = GameSnapshot(tuple(priority + others), len(priority), {})
+    display.update_ticker(snapshot)
+
+    def ticker_scroll(frame):
+        display.scroll_pos += 0.5
+        display.draw_ticker_frame(frame / 60)
+
+    def ticker_score(frame):
+        changed = list(others)
+        i = frame % len(changed)
+        # Same number of digits, so the tile keeps its width
+        changed[i] = changed[i]._replace(home_score=changed[i].home_score ^ 1)
+        display.update_ticker(snapshot._replace(games=tuple(priority + changed)))
+        display.draw_ticker_frame(frame / 60)
+
+    return scenarios + [('ticker frame', ticker_scroll), ('ticker score', ticker_score)]
+
+
+def bench_render(args):
+    """Frames/sec, latency and allocations of each render path on the headless backend"""
+    import ticker
+    from sports_display import SportsScoreDisplay
+
+    display = SportsScoreDisplay(backend='headless')
+    if ticker.Image is None:
+        print("PIL is not installed, skipping the ticker scenarios")
+    elif display.ticker is None:
+        display.ticker = ticker.TickerRenderer(display.matrix.height, FONT_LARGE, FONT_SMALL,
+                                               TICKER_FONT_LARGE_SIZE, TICKER_FONT_SMALL_SIZE,
+                                               display.team_rgb)
+    for path in args.payloads or ['-']:
+        data = decode_scoreboard(load_payload(path, args.events), 'selective')
+        games = display.parse_game_data(data, 'NCAAF', 'college-football')
+        name = path if path != '-' else f'synthetic ({args.events} events)'
+        print(f"{name}: {len(games)} games, {args.frames} frames per scenario, "
+              f"{display.layout.games_per_frame} games per frame")
+        print(f"  {'scenario':<18} {'fps':>8} {'mean ms':>8} {'p95 ms':>8} {'peak KB':>8} {'blocks/f':>9}")
+
+        for scenario, draw in render_scenarios(display, games):
+            latencies, peak, blocks = run_frames(draw, args.frames)
+            latencies.sort()
+            mean = sum(latencies) / len(latencies)
+            p95 = latencies[int(len(latencies) * 0.95)]
+            print(f"  {scenario:<18} {1 / mean:>8.0f} {mean * 1000:>8.3f} {p95 * 1000:>8.3f} "
+                  f"{peak / 1024:>8.1f} {blocks:>9.2f}")
+
+
+def bench_parse(args):
+    """Compare decode modes on each payload"""
+    for path in args.payloads or ['-']:
+        body = load_payload(path, args.events)
+        name = path if path != '-' else f'synthetic ({args.events} events)'
+        print(f"{name}: {len(body) / 1024:.0f} KB")
+        print(f"  {'mode':<10} {'events':>6} {'best ms':>9} {'mean ms':>9} {'RSS +KB':>9} {'traced KB':>10}")
+
+        for mode in PARSE_MODES:
+            if mode == 'stream' and ijson is None:
+                print(f"  {mode:<10} skipped, ijson is not installed")
+                continue
+            output = subprocess.run([sys.executable, __file__, 'parse-child', path, mode,
+                                     str(args.repeats), str(args.events)],
+                                    check=True, capture_output=True, text=True).stdout
+            result = json.loads(output)
+            print(f"  {mode:<10} {result['events']:>6} {result['best_ms']:>9.1f} {result['mean_ms']:>9.1f} "
+                  f"{result['rss_growth_kb']:>9} {result['traced_peak_kb']:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parse = commands.add_parser('parse', help='scoreboard decode time and memory per PARSE_MODE')
+    parse.add_argument('payloads', nargs='*', help='recorded scoreboard JSON files')
+    parse.add_argument('--repeats', type=int, default=5)
+    parse.add_argument('--events', type=int, default=300, help='size of the synthetic slate')
+    parse.set_defaults(func=bench_parse)
+
+    memory = commands.add_parser('memory', help='memory kept by per-game dicts vs Game records')
+    memory.add_argument('payloads', nargs='*', help='recorded scoreboard JSON files')
+    memory.add_argument('--refreshes', type=int, default=20)
+    memory.add_argument('--events', type=int, default=300, help='size of the synthetic slate')
+    memory.set_defaults(func=bench_memory)
+
+    priority = commands.add_parser('priority', help='priority team matching, substring vs compiled')
+    priority.add_argument('payloads', nargs='*', help='recorded scoreboard JSON files')
+    priority.add_argument('--league', default='college-football')
+    priority.add_argument('--refreshes', type=int, default=100)
+    priority.add_argument('--events', type=int, default=300, help='size of the synthetic slate')
+    priority.set_defaults(func=bench_priority)
+
+    render = commands.add_parser('render', help='frame rate and latency of each render path, headless')
+    render.add_argument('payloads', nargs='*', help='recorded scoreboard JSON files')
+    render.add_argument('--frames', type=int, default=500)
+    render.add_argument('--events', type=int, default=300, help='size of the synthetic slate')
+    render.set_defaults(func=bench_render)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 6 and sys.argv[1] == 'parse-child':
+        parse_child(sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5]))
+    else:
+        main()
@@ -4,12 +4,21 @@ Edit this file to customize your display
 """
 
 # Matrix Configuration
-MATRIX_WIDTH = 128
+MATRIX_WIDTH = 128  # Size of one panel, or of one chain of panels if they are set up as one
 MATRIX_HEIGHT = 32
+MATRIX_CHAIN_LENGTH = 1  # Panels daisy-chained side by side
+MATRIX_PARALLEL = 1  # Chains stacked on top of each other, each one holds another row of games
 MATRIX_HARDWARE_MAPPING = 'regular'  # Options: 'regular', 'adafruit-hat', 'adafruit-hat-pwm'
 MATRIX_GPIO_SLOWDOWN = 4  # Increase if flickering (try 2, 3, 4, or 5)
+DISPLAY_BACKEND = 'rgbmatrix'  # 'headless' draws to memory instead, for testing off the Pi
+FRAME_CACHE_SIZE = 12  # Frames of games kept drawn and ready to show
+MAX_GAMES_PER_FRAME = 0  # Games shown side by side, 0 fits as many as the fonts allow
+GAME_TILE_WIDTH = 0  # Minimum width of each game, 0 sizes it to the fonts
 
 # Priority teams - these will be checked more frequently and displayed first
+# Each entry must exactly match (ignoring case) the team's ESPN id, abbreviation,
+# full name, short name, nickname or school/city, e.g. 'Arkansas' matches the
+# Razorbacks but not Arkansas State
 PRIORITY_TEAMS = {
     'mlb': ['Houston Astros', 'Astros', 'HOU'],
     'college-football': ['Arkansas Razorbacks', 'Razorbacks', 'Arkansas', 'ARK'],
@@ -17,20 +26,79 @@ PRIORITY_TEAMS = {
     'college-baseball': ['Arkansas Razorbacks', 'Razorbacks', 'Arkansas', 'ARK']
 }
 
+# Optional regular expressions tried against a team's full name when nothing
+# in PRIORITY_TEAMS matches exactly, e.g. {'nfl': [r'^Houston ']}
+PRIORITY_TEAM_PATTERNS = {}
+
 # Display timing (in seconds)
 PRIORITY_GAME_DISPLAY_TIME = 8
 NON_PRIORITY_GAME_DISPLAY_TIME = 3
-PRIORITY_UPDATE_INTERVAL = 5  # How often to check priority games for score changes
-FULL_UPDATE_INTERVAL = 60  # How often to refresh all games
+SCORE_HIGHLIGHT = 'priority'  # Jump straight to games whose score changes: 'priority', 'all' or 'off'
+SCORE_FLASH_COUNT = 3  # Times a new score blinks
+SCORE_FLASH_TIME = 0.15  # Seconds each blink lasts
+PRIORITY_UPDATE_INTERVAL = 5  # How often to check priority games in progress for score changes (wall clock)
+FULL_UPDATE_INTERVAL = 60  # How often to refresh leagues with games in progress (wall clock)
+
+# Adaptive polling (in seconds): each league is polled as often as its games need
+PRE_GAME_POLL_INTERVAL = 300  # None of its games have started yet
+BREAK_POLL_INTERVAL = 120  # Every game in progress is at halftime or delayed
+CLOSE_GAME_POLL_INTERVAL = 15  # A close game near the end
+IDLE_POLL_INTERVAL = 1800  # No games today, or out of season
+BREAK_STATUS_PATTERN = r'halftime|delay|postponed|suspended'  # Game statuses that count as a break
+# Per sport: the biggest margin that still counts as close, and a pattern
+# matching the game status near the end
+CLOSE_GAME_RULES = {
+    'baseball': (2, r'\b(9|1\d|2\d)th\b'),  # 9th inning or extras
+    'football': (8, r'\b4th\b|OT'),
+    'basketball': (6, r'\b4th\b|2nd Half|OT'),
+}
+
+# Display mode: 'rotate' shows one game at a time, 'ticker' pins the priority
+# game on the left and scrolls every other game past it (needs python3-pil)
+DISPLAY_MODE = 'rotate'
+TICKER_SPEED = 32  # Pixels per second
+TICKER_FPS = 60  # Frames per second while scrolling
+TICKER_PINNED_WIDTH = 48  # Width of the pinned priority game, 0 to scroll everything
+TICKER_FONT_LARGE_SIZE = 9  # Point sizes for the ticker's TrueType fonts
+TICKER_FONT_SMALL_SIZE = 7
+
+# Network timeouts (in seconds)
+FETCH_CONNECT_TIMEOUT = 3  # Time allowed to open a connection to ESPN
+FETCH_TIMEOUT = 5  # Time allowed for ESPN to send a response
+FETCH_DEADLINE = 6  # Leagues not back by this deadline are skipped for that refresh
+
+# Protection for ESPN, per league
+# Requests per second on average, twice what the priority checks and close game polls need
+FETCH_RATE_LIMIT = 2 * (1 / PRIORITY_UPDATE_INTERVAL + 1 / CLOSE_GAME_POLL_INTERVAL)
+FETCH_BURST = 3  # Requests allowed back to back
+FETCH_FAILURE_THRESHOLD = 3  # Failures in a row before backing off
+FETCH_BACKOFF = 10  # First backoff in seconds, doubled after each failed retry
+FETCH_MAX_BACKOFF = 300  # Longest backoff in seconds
+STALE_SCORE_AGE = 90  # Show how old the scores are once a failing league's are older than this (seconds)
+
+# How scoreboard responses are decoded: 'full' (whole document), 'selective'
+# (only the fields the display uses) or 'stream' (one game at a time, needs
+# "pip3 install ijson")
+PARSE_MODE = 'selective'
+
+# Last known scores are saved here so a restart can show them right away
+SCORE_CACHE_FILE = 'score_cache.json'  # Relative to the install directory
+SCORE_CACHE_MAX_AGE = 3 * 60 * 60  # Ignore saved scores older than this (seconds)
+
+# Metrics on the hot paths, for sizing polling intervals and spotting a busy CPU
+METRICS_HOST = '127.0.0.1'  # '0.0.0.0' to allow scraping from other machines
+METRICS_PORT = 9101  # Served at http://localhost:9101/metrics, 0 to turn off
+METRICS_LOG_INTERVAL = 300  # Seconds between "metrics {...}" JSON lines in the log, 0 to turn off
 
 # Sports to track
+# 'teams' names the file in teams/ with that league's colors (defaults to the league)
 SPORTS_CONFIG = [
     {'name': 'MLB', 'sport': 'baseball', 'league': 'mlb'},
     {'name': 'NFL', 'sport': 'football', 'league': 'nfl'},
     {'name': 'NBA', 'sport': 'basketball', 'league': 'nba'},
-    {'name': 'NCAAF', 'sport': 'football', 'league': 'college-football'},
-    {'name': 'NCAAB', 'sport': 'basketball', 'league': 'mens-college-basketball'},
-    {'name': 'NCAABB', 'sport': 'baseball', 'league': 'college-baseball'}
+    {'name': 'NCAAF', 'sport': 'football', 'league': 'college-football', 'teams': 'college'},
+    {'name': 'NCAAB', 'sport': 'basketball', 'league': 'mens-college-basketball', 'teams': 'college'},
+    {'name': 'NCAABB', 'sport': 'baseball', 'league': 'college-baseball', 'teams': 'college'}
 ]
 
 # Font paths
@@ -0,0 +1,80 @@
+"""
+Frame cache for the Sports Score Display
+Keeps already drawn off-screen canvases so unchanged frames are never redrawn
+"""
+
+from collections import OrderedDict
+
+
+class CachedFrame:
+    __slots__ = ('canvas', 'fields')
+
+    def __init__(self, canvas, fields):
+        self.canvas = canvas
+        # The render-relevant values the canvas was drawn with
+        self.fields = fields
+
+
+class FrameCache:
+    """LRU cache of drawn canvases
+
+    rgbmatrix canvases can't be freed once created, so the cache creates at
+    most `size` of them and recycles evicted ones. A canvas that is on screen
+    must never be drawn on, so callers pass it as `busy` and it is skipped
+    when a canvas is needed.
+    """
+
+    def __init__(self, create_canvas, size):
+        self.create_canvas = create_canvas
+        self.size = max(2, size)
+        self.created = 0
+        self.entries = OrderedDict()
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached frame for key, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return entry
+
+    def acquire(self, key, fields, busy=None):
+        """A new, blank frame for key
+
+        Reuses a free canvas, creates one while under `size`, or evicts the
+        least recently used frame that isn't `busy`.
+        """
+        self.evict(key)
+        canvas = None
+        for i, free_canvas in enumerate(self.free):
+            if free_canvas is not busy:
+                canvas = self.free.pop(i)
+                break
+        if canvas is None and self.created < self.size:
+            canvas = self.create_canvas()
+            self.created += 1
+        if canvas is None:
+            for old_key, entry in self.entries.items():
+                if entry.canvas is not busy:
+                    canvas = self.entries.pop(old_key).canvas
+                    break
+
+        canvas.Clear()
+        entry = self.entries[key] = CachedFrame(canvas, fields)
+        return entry
+
+    def evict(self, key):
+        """Drop the frame for key and recycle its canvas"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.free.append(entry.canvas)
+
+    def retain(self, keys):
+        """Evict every frame whose key is not in keys"""
+        for key in [key for key in self.entries if key not in keys]:
+            self.evict(key)
@@ -0,0 +1,119 @@
+"""
+Game store for the Sports Score Display
+Keeps the current games indexed by id and turns each fetch into change events
+"""
+
+import sys
+from collections import namedtuple
+
+# Kinds of change reported by GameStore.apply
+ADDED = 'added'
+REMOVED = 'removed'
+SCORE_CHANGED = 'score_changed'
+STATUS_CHANGED = 'status_changed'
+
+# A single change to a game. For REMOVED, game is the last known state of the
+# game; previous is the game before the change and None for ADDED and REMOVED.
+GameEvent = namedtuple('GameEvent', ['kind', 'game', 'previous'])
+
+
+# One game as shown on the display. A namedtuple has no per-instance dict,
+# and being immutable it can be shared between snapshots as is.
+Game = namedtuple('Game', ['id', 'league', 'league_key', 'away_team', 'home_team',
+                           'away_score', 'home_score', 'status', 'state', 'is_priority'])
+
+
+def parse_score(score):
+    """Scores come from ESPN as strings, parse them once"""
+    try:
+        return int(score)
+    except (TypeError, ValueError):
+        return 0
+
+
+def make_game(game_id, league_name, league_key, away, home, status, state, is_priority):
+    """Build a Game from ESPN competitor dicts
+
+    Identifiers and status strings repeat across games and refreshes, so
+    they are interned rather than kept as fresh copies from every payload.
+    """
+    intern = sys.intern
+    return Game(intern(game_id), intern(league_name), intern(league_key),
+                intern(away.get('team', {}).get('abbreviation', 'TBD')[:4]),
+                intern(home.get('team', {}).get('abbreviation', 'TBD')[:4]),
+                parse_score(away.get('score', '0')), parse_score(home.get('score', '0')),
+                intern(status), intern(state), is_priority)
+
+
+def game_key(game):
+    """Key a game by league as well as id, ESPN ids are only unique per sport"""
+    return (game.league_key, game.id)
+
+
+class GameStore:
+    def __init__(self):
+        self.games = {}
+        self.listeners = []
+
+    def subscribe(self, listener):
+        """Call listener with the list of events from every apply() that changed something"""
+        self.listeners.append(listener)
+
+    def load(self, games):
+        """Replace the store contents without reporting any events"""
+        self.games = {game_key(game): game for game in games}
+
+    def apply(self, games, league_keys, event_ids=None):
+        """Apply a fetch to the store and return the resulting events
+
+        games is everything that was fetched for league_keys. Any stored game
+        from those leagues that is missing from games has ended (finished
+        games are dropped by the parser) and is evicted. When event_ids is
+        given ({league_key: set of ids}) only those events were fetched, so
+        only they can be evicted. Leagues that were not fetched at all are
+        left untouched.
+        """
+        events = []
+        seen = set()
+
+        for game in games:
+            key = game_key(game)
+            seen.add(key)
+            previous = self.games.get(key)
+            self.games[key] = game
+
+            if previous is None:
+                events.append(GameEvent(ADDED, game, None))
+                continue
+            if (game.away_score != previous.away_score or
+                    game.home_score != previous.home_score):
+                events.append(GameEvent(SCORE_CHANGED, game, previous))
+            if game.state != previous.state or game.status != previous.status:
+                events.append(GameEvent(STATUS_CHANGED, game, previous))
+
+        for key in list(self.games):
+            league_key, game_id = key
+            if key in seen or league_key not in league_keys:
+                continue
+            if event_ids is not None and game_id not in event_ids.get(league_key, ()):
+                continue
+            events.append(GameEvent(REMOVED, self.games.pop(key), None))
+
+        if events:
+            for listener in self.listeners:
+                listener(events)
+        return events
+
+    def priority_games(self):
+        """Priority games in the order they were first seen"""
+        return [game for game in self.games.values() if game.is_priority]
+
+    def league_games(self, league_key):
+        """Games from one league"""
+        return [game for game in self.games.values() if game.league_key == league_key]
+
+    def ordered_games(self):
+        """All games, priority games first"""
+        games = list(self.games.values())
+        return ([game for game in games if game.is_priority] +
+                [game for game in games if not game.is_priority])
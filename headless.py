@@ -0,0 +1,209 @@
+"""
+Headless display backend for the Sports Score Display
+An in-memory stand-in for the parts of rgbmatrix the display uses, so it can
+be run, profiled and benchmarked on any machine
+
+It mirrors both rgbmatrix.RGBMatrix/RGBMatrixOptions and rgbmatrix.graphics,
+so this module can be passed anywhere the display expects `graphics`.
+"""
+
+
+class Color:
+    __slots__ = ('red', 'green', 'blue')
+
+    def __init__(self, red=0, green=0, blue=0):
+        self.red = red
+        self.green = green
+        self.blue = blue
+
+
+class Glyph:
+    __slots__ = ('advance', 'width', 'height', 'x_offset', 'y_offset', 'rows')
+
+    def __init__(self, advance, width, height, x_offset, y_offset, rows):
+        self.advance = advance
+        self.width = width
+        self.height = height
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        # One int per row, most significant bit is the leftmost pixel
+        self.rows = rows
+
+
+class Font:
+    """BDF font, like graphics.Font
+
+    rgbmatrix can only load BDF fonts. Anything else (a missing file, a TTF)
+    falls back to a fixed 5x7 block font so text still costs roughly what it
+    would on the Pi.
+    """
+
+    def __init__(self):
+        self.height = 8
+        self.baseline = 7
+        self.glyphs = {}
+        self.default = Glyph(6, 5, 7, 0, 0, [0b11111] * 7)
+
+    def LoadFont(self, path):
+        try:
+            with open(path, encoding='latin-1') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        if not lines or not lines[0].startswith('STARTFONT'):
+            return
+        self.parse_bdf(lines)
+
+    def parse_bdf(self, lines):
+        glyph = None
+        bitmap = None
+        for line in lines:
+            parts = line.split()
+            if not parts:
+                continue
+            keyword = parts[0]
+            if keyword == 'FONTBOUNDINGBOX':
+                self.height = int(parts[2])
+                self.baseline = int(parts[2]) + int(parts[4])
+            elif keyword == 'STARTCHAR':
+                glyph = {'encoding': -1, 'advance': 0, 'bbx': (0, 0, 0, 0)}
+            elif keyword == 'ENCODING' and glyph is not None:
+                glyph['encoding'] = int(parts[1])
+            elif keyword == 'DWIDTH' and glyph is not None:
+                glyph['advance'] = int(parts[1])
+            elif keyword == 'BBX' and glyph is not None:
+                glyph['bbx'] = tuple(int(part) for part in parts[1:5])
+            elif keyword == 'BITMAP':
+                bitmap = []
+            elif keyword == 'ENDCHAR':
+                width, height, x_offset, y_offset = glyph['bbx']
+                bits = ((width + 7) // 8) * 8
+                rows = [int(row, 16) >> (bits - width) for row in bitmap or []]
+                self.glyphs[glyph['encoding']] = Glyph(glyph['advance'], width, height,
+                                                       x_offset, y_offset, rows)
+                glyph = None
+                bitmap = None
+            elif bitmap is not None:
+                bitmap.append(keyword)
+
+    def glyph(self, codepoint):
+        return self.glyphs.get(codepoint, self.default)
+
+    def CharacterWidth(self, codepoint):
+        return self.glyph(codepoint).advance
+
+
+def DrawText(canvas, font, x, y, color, text):
+    """Draw text with its baseline at y, returns the width drawn"""
+    start = x
+    for char in text:
+        glyph = font.glyph(ord(char))
+        # Same placement as rgbmatrix, which ignores the BBX x offset
+        top = y - glyph.height - glyph.y_offset
+        left = x
+        for row, bits in enumerate(glyph.rows):
+            column = glyph.width - 1
+            while bits:
+                if bits & 1:
+                    canvas.SetPixel(left + column, top + row, color.red, color.green, color.blue)
+                bits >>= 1
+                column -= 1
+        x += glyph.advance
+    return x - start
+
+
+def DrawLine(canvas, x0, y0, x1, y1, color):
+    """Bresenham line, like graphics.DrawLine"""
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    error = dx + dy
+    while True:
+        canvas.SetPixel(x0, y0, color.red, color.green, color.blue)
+        if x0 == x1 and y0 == y1:
+            return
+        double_error = 2 * error
+        if double_error >= dy:
+            error += dy
+            x0 += step_x
+        if double_error <= dx:
+            error += dx
+            y0 += step_y
+
+
+class FrameCanvas:
+    """RGB framebuffer with the FrameCanvas drawing methods"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 3)
+
+    def Clear(self):
+        self.pixels[:] = bytes(len(self.pixels))
+
+    def Fill(self, red, green, blue):
+        self.pixels[:] = bytes((red, green, blue)) * (self.width * self.height)
+
+    def SetPixel(self, x, y, red, green, blue):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (y * self.width + x) * 3
+            self.pixels[i:i + 3] = bytes((red, green, blue))
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        """Copy a PIL RGB image onto the canvas, clipped to its edges"""
+        image_width, image_height = image.size
+        data = image.tobytes()
+        x_start = max(0, offset_x)
+        x_end = min(self.width, offset_x + image_width)
+        if x_start >= x_end:
+            return
+        for y in range(max(0, offset_y), min(self.height, offset_y + image_height)):
+            source = ((y - offset_y) * image_width + x_start - offset_x) * 3
+            target = (y * self.width + x_start) * 3
+            length = (x_end - x_start) * 3
+            self.pixels[target:target + length] = data[source:source + length]
+
+    def GetPixel(self, x, y):
+        i = (y * self.width + x) * 3
+        return tuple(self.pixels[i:i + 3])
+
+    def save(self, path):
+        """Write the canvas as a binary PPM image"""
+        with open(path, 'wb') as f:
+            f.write(b'P6 %d %d 255\n' % (self.width, self.height))
+            f.write(self.pixels)
+
+
+class RGBMatrixOptions:
+    def __init__(self):
+        self.rows = 32
+        self.cols = 32
+        self.chain_length = 1
+        self.parallel = 1
+        self.hardware_mapping = 'regular'
+        self.gpio_slowdown = 1
+
+
+class RGBMatrix:
+    """Matrix that keeps the front canvas in memory instead of on the panel"""
+
+    def __init__(self, options=None):
+        options = options or RGBMatrixOptions()
+        self.width = options.cols * options.chain_length
+        self.height = options.rows * options.parallel
+        self.front = FrameCanvas(self.width, self.height)
+        self.swaps = 0
+
+    def CreateFrameCanvas(self):
+        return FrameCanvas(self.width, self.height)
+
+    def SwapOnVSync(self, canvas, framerate_fraction=1):
+        previous = self.front
+        self.front = canvas
+        self.swaps += 1
+        return previous
+
+    def Clear(self):
+        self.front.Clear()
@@ -0,0 +1,96 @@
+"""
+Layout for the Sports Score Display
+Splits the matrix into game tiles sized from the loaded fonts
+"""
+
+from collections import namedtuple
+
+# Area of the matrix one game is drawn in
+Tile = namedtuple('Tile', ['x', 'y', 'width'])
+
+GAME_HEIGHT = 32
+PADDING = 2
+# Baselines of the lines of a tile, from its top
+HEADER_BASELINE = 8
+AWAY_BASELINE = 17
+HOME_BASELINE = 25
+STATUS_BASELINE = 32
+# Longest team abbreviation and score drawn
+TEAM_CHARS = 4
+SCORE_CHARS = 3
+
+
+def measure_font(font):
+    """Advance width of every printable ASCII character in a font
+
+    rgbmatrix reports -1 for characters a font doesn't have, those count as 0.
+    """
+    return {chr(codepoint): max(0, font.CharacterWidth(codepoint))
+            for codepoint in range(32, 127)}
+
+
+def line_rows(font, baseline):
+    """Rows (first, last) a line of text can cover, clipped to the tile
+
+    Glyphs are drawn with their top at baseline - glyph height - y offset,
+    so a line spans the font's bounding box: baseline rows above the
+    baseline and the rest of the font's height below it.
+    """
+    top = baseline - font.baseline
+    return (max(0, top), min(GAME_HEIGHT - 1, top + font.height - 1))
+
+
+class Layout:
+    """Tiles as many games as fit across and down the matrix
+
+    Character widths are measured once from the loaded fonts. A tile is just
+    wide enough for a four letter team, a gap and a three digit score, unless
+    tile_width asks for more; the width left over is shared between the
+    tiles. Each extra row of chained panels (parallel) holds another row of
+    games. The rows each line covers come from the fonts too, and can
+    overlap when the fonts are tall.
+    """
+
+    def __init__(self, width, height, font_large, font_small, tile_width=0, max_games=0):
+        self.large = measure_font(font_large)
+        self.small = measure_font(font_small)
+        self.header_rows = line_rows(font_small, HEADER_BASELINE)
+        # Teams and scores share the two middle lines
+        self.score_rows = (line_rows(font_large, AWAY_BASELINE)[0],
+                           line_rows(font_large, HOME_BASELINE)[1])
+        self.status_rows = line_rows(font_small, STATUS_BASELINE)
+        # Rows only the scores use, safe to fill behind them
+        self.score_block_rows = (max(self.score_rows[0], self.header_rows[1] + 1),
+                                 min(self.score_rows[1], self.status_rows[0] - 1))
+
+        team_width = TEAM_CHARS * max(self.large[char] for char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        self.score_width = SCORE_CHARS * max(self.large[char] for char in '0123456789')
+        # Where scores start, relative to the tile
+        self.score_x = PADDING + team_width + PADDING
+        tile_width = max(tile_width, self.score_x + self.score_width + PADDING)
+
+        columns = max(1, width // tile_width)
+        rows = max(1, height // GAME_HEIGHT)
+        if max_games:
+            columns = min(columns, max_games)
+            rows = min(rows, max(1, max_games // columns))
+        tile_width = width // columns
+        self.tiles = tuple(Tile(column * tile_width, row * GAME_HEIGHT, tile_width)
+                           for row in range(rows) for column in range(columns))
+
+    @property
+    def games_per_frame(self):
+        return len(self.tiles)
+
+    def text_width(self, widths, text):
+        """Width of text drawn in the font that widths was measured from"""
+        return sum(widths.get(char, 0) for char in text)
+
+    def fit(self, widths, text, width):
+        """The longest start of text that fits in width pixels"""
+        used = 0
+        for i, char in enumerate(text):
+            used += widths.get(char, 0)
+            if used > width:
+                return text[:i]
+        return text
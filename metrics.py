@@ -0,0 +1,215 @@
+"""
+Metrics for the Sports Score Display
+Counters, gauges and latency histograms, served in the Prometheus text format
+"""
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds in seconds, from a fast frame up to a slow fetch
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def format_labels(key):
+    if not key:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in key) + '}'
+
+
+def summary_key(key):
+    """Labels as league=mlb,result=ok for the structured log"""
+    return ','.join(f'{name}={value}' for name, value in key) or 'value'
+
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def samples(self):
+        """(suffix, label pairs, value) for every sample"""
+        with self.lock:
+            return [('', key, value) for key, value in self.values.items()]
+
+    def summary(self):
+        with self.lock:
+            return {summary_key(key): value for key, value in self.values.items()}
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = label_key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def set(self, value, **labels):
+        """Mirror a count kept somewhere else"""
+        with self.lock:
+            self.values[label_key(labels)] = value
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self.lock:
+            self.values[label_key(labels)] = value
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = buckets
+
+    def observe(self, value, **labels):
+        key = label_key(labels)
+        with self.lock:
+            counts = self.values.get(key)
+            if counts is None:
+                # One count per bucket, the +Inf count, then the sum
+                counts = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            counts[-1] += value
+
+    def samples(self):
+        samples = []
+        with self.lock:
+            for key, counts in self.values.items():
+                total = 0
+                for bound, count in zip(self.buckets + ('+Inf',), counts):
+                    total += count
+                    samples.append(('_bucket', key + (('le', bound),), total))
+                samples.append(('_count', key, total))
+                samples.append(('_sum', key, counts[-1]))
+        return samples
+
+    def quantile(self, counts, q):
+        """Upper bound of the bucket holding the q quantile, None past the last bucket"""
+        total = sum(counts[:-1])
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            if running >= q * total:
+                return bound
+        return None
+
+    def summary(self):
+        with self.lock:
+            return {summary_key(key): {
+                'count': sum(counts[:-1]),
+                'mean': round(counts[-1] / max(1, sum(counts[:-1])), 6),
+                'p95': self.quantile(counts, 0.95)}
+                for key, counts in self.values.items()}
+
+
+class Registry:
+    """All the metrics, and hooks that update gauges just before they are read"""
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text):
+        return self.add(Counter(name, help_text))
+
+    def gauge(self, name, help_text):
+        return self.add(Gauge(name, help_text))
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS):
+        return self.add(Histogram(name, help_text, buckets))
+
+    def on_collect(self, collector):
+        """Call collector() before every render() or summary()"""
+        self.collectors.append(collector)
+
+    def collect(self):
+        for collector in self.collectors:
+            try:
+                collector()
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+
+    def render(self):
+        """Every metric in the Prometheus text exposition format"""
+        self.collect()
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for suffix, key, value in metric.samples():
+                lines.append(f'{metric.name}{suffix}{format_labels(key)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """Every metric as plain values, for the structured log"""
+        self.collect()
+        return {metric.name: metric.summary() for metric in self.metrics if metric.values}
+
+
+def serve(registry, host, port):
+    """Serve /metrics from a daemon thread, returns the server"""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes would flood the journal
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics', daemon=True).start()
+    return server
+
+
+class DisplayMetrics(Registry):
+    """The metrics the display records"""
+
+    def __init__(self):
+        super().__init__()
+        self.fetch_seconds = self.histogram('fetch_seconds', 'Time to fetch a scoreboard, by league')
+        self.fetch_requests = self.counter('fetch_requests_total',
+                                           'Scoreboard fetches, by league and result')
+        self.fetch_bytes = self.counter('fetch_bytes_total', 'Scoreboard bytes downloaded, by league')
+        self.decode_seconds = self.histogram('decode_seconds', 'Time to decode a scoreboard, by league')
+        self.parse_seconds = self.histogram('parse_seconds',
+                                            'Time to turn a scoreboard into games, by league')
+        self.refresh_seconds = self.histogram('refresh_seconds', 'Time for a whole refresh, by kind')
+        self.render_seconds = self.histogram('render_seconds', 'Time to draw a frame, by mode')
+        self.swap_seconds = self.histogram('swap_seconds', 'Time spent waiting in SwapOnVSync')
+        self.score_change_seconds = self.histogram('score_change_display_seconds',
+                                                   'Time from fetching a score change to showing it')
+        self.late_frames = self.counter('ticker_late_frames_total',
+                                        'Ticker frames that missed their deadline')
+        self.frame_cache = self.counter('frame_cache_lookups_total', 'Frame cache lookups, by result')
+        self.score_age = self.gauge('score_age_seconds', 'Time since each league last answered')
+        self.poll_interval = self.gauge('poll_interval_seconds', 'Current polling interval, by league')
+        self.games = self.gauge('games', 'Games being shown, by league')
+        self.cpu_seconds = self.counter('process_cpu_seconds_total', 'CPU time used by the display')
@@ -0,0 +1,78 @@
+"""
+Adaptive polling for the Sports Score Display
+Works out how often each league needs fetching from the state of its games
+"""
+
+import re
+
+
+class PollScheduler:
+    """When each league is due to be fetched next
+
+    A league is polled as often as its most urgent game needs:
+    close_interval for a close game near the end, live_interval for any
+    other game in progress, break_interval when the game is at halftime,
+    between periods or delayed, and pre_game_interval before it starts. A
+    league with no games at all (nothing on today, or out of season) is
+    only checked every idle_interval.
+    """
+
+    def __init__(self, sports, live_interval, pre_game_interval, break_interval,
+                 close_interval, idle_interval, break_pattern, close_rules):
+        # League key -> sport, for the close game rules
+        self.sports = sports
+        self.live_interval = live_interval
+        self.pre_game_interval = pre_game_interval
+        self.break_interval = break_interval
+        self.close_interval = close_interval
+        self.idle_interval = idle_interval
+        self.break_status = re.compile(break_pattern, re.IGNORECASE)
+        self.close_rules = {sport: (margin, re.compile(pattern, re.IGNORECASE))
+                            for sport, (margin, pattern) in close_rules.items()}
+        # Everything is due straight away
+        self.next_poll = {league_key: 0.0 for league_key in sports}
+        self.intervals = {}
+
+    def is_close_and_late(self, game):
+        rule = self.close_rules.get(self.sports.get(game.league_key))
+        if rule is None:
+            return False
+        margin, late = rule
+        return abs(game.away_score - game.home_score) <= margin and bool(late.search(game.status))
+
+    def game_interval(self, game):
+        """How often a single game needs checking"""
+        if game.state == 'pre':
+            return self.pre_game_interval
+        if self.break_status.search(game.status):
+            return self.break_interval
+        if self.is_close_and_late(game):
+            return self.close_interval
+        return self.live_interval
+
+    def is_active(self, game):
+        """True if the game is being played right now, not before it or in a break"""
+        return self.game_interval(game) <= self.live_interval
+
+    def league_interval(self, games):
+        return min((self.game_interval(game) for game in games), default=self.idle_interval)
+
+    def due(self, now):
+        """Leagues whose next poll is due"""
+        return [league_key for league_key, deadline in self.next_poll.items() if deadline <= now]
+
+    def schedule(self, league_key, games, now):
+        """Set a league's next poll from its current games, returns the interval"""
+        interval = self.league_interval(games)
+        self.next_poll[league_key] = now + interval
+        self.intervals[league_key] = interval
+        return interval
+
+    def schedule_retry(self, league_key, games, now):
+        """Poll a league that failed to answer again soon, rather than after an idle interval"""
+        interval = min(self.league_interval(games), self.live_interval)
+        self.next_poll[league_key] = now + interval
+        return interval
+
+    def next_wakeup(self):
+        return min(self.next_poll.values(), default=float('inf'))
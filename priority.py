@@ -0,0 +1,56 @@
+"""
+Priority team matching for the Sports Score Display
+Compiles PRIORITY_TEAMS once into exact per-league lookups
+"""
+
+import re
+
+# Team fields a PRIORITY_TEAMS entry is compared against
+TEAM_FIELDS = ('id', 'abbreviation', 'displayName', 'shortDisplayName', 'name', 'location')
+
+
+class PriorityMatcher:
+    """Decides whether an ESPN team is one of the priority teams
+
+    A PRIORITY_TEAMS entry matches when it equals (ignoring case) the team's
+    ESPN id, abbreviation, display name, short name, nickname or location.
+    Matching is exact, so 'Arkansas' matches the Razorbacks (location
+    Arkansas) but not Arkansas State. Optional regular expressions are tried
+    against the display name when nothing matches exactly.
+
+    The answer for each ESPN team id is remembered, so after the first
+    refresh every competitor costs a single dict lookup.
+    """
+
+    def __init__(self, priority_teams, patterns=None):
+        self.names = {league: frozenset(str(name).lower() for name in names)
+                      for league, names in priority_teams.items()}
+        self.patterns = {league: [re.compile(pattern, re.IGNORECASE) for pattern in league_patterns]
+                         for league, league_patterns in (patterns or {}).items()}
+        self.by_id = {}
+
+    def matches(self, league_key, team):
+        """True if the team dict from a competitor is a priority team"""
+        team_id = team.get('id')
+        if team_id is not None:
+            key = (league_key, team_id)
+            result = self.by_id.get(key)
+            if result is None:
+                result = self.by_id[key] = self.check(league_key, team)
+            return result
+        return self.check(league_key, team)
+
+    def check(self, league_key, team):
+        """Match a team against the compiled config without the id cache"""
+        names = self.names.get(league_key)
+        if names:
+            for field in TEAM_FIELDS:
+                value = team.get(field)
+                if value and str(value).lower() in names:
+                    return True
+
+        display_name = team.get('displayName', '')
+        for pattern in self.patterns.get(league_key, ()):
+            if pattern.search(display_name):
+                return True
+        return False
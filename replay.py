@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Record and replay ESPN feeds for the Sports Score Display
+
+    python3 replay.py record scores.jsonl        # run the display, saving every response
+    python3 replay.py play scores.jsonl --speed 10
+    python3 replay.py synthetic --games 150      # a slate of games that keep scoring
+    python3 replay.py latency scores.jsonl       # score change to pixel latency, headless
+    python3 replay.py latency --games 150
+
+Each source stands in for the display's requests session, so fetching,
+conditional requests, decoding and rendering all run exactly as they do
+against ESPN. Recordings ending in .gz are compressed.
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+
+from game_store import parse_score
+from scoreboard import decode_scoreboard
+from synthetic import SyntheticSlate
+
+
+def open_recording(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def league_from_url(url):
+    """League key from a .../sports/{sport}/{league}/scoreboard URL"""
+    return url.rstrip('/').split('/')[-2]
+
+
+def game_scores(body):
+    """(event id, away score, home score) for every event in a scoreboard body"""
+    scores = []
+    for event in decode_scoreboard(body).get('events', []):
+        competitors = event.get('competitions', [{}])[0].get('competitors', [])
+        if len(competitors) >= 2:
+            scores.append((event.get('id', ''), parse_score(competitors[0].get('score')),
+                           parse_score(competitors[1].get('score'))))
+    return scores
+
+
+class ReplayResponse:
+    """Just enough of requests.Response for fetch_scores"""
+
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class RecordingSession:
+    """Wraps a requests session and appends every good response to a file
+
+    Each line is one response: the wall clock time, URL, validators and body.
+    """
+
+    def __init__(self, session, path):
+        self.session = session
+        self.file = open_recording(path, 'a')
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        response = self.session.get(url, **kwargs)
+        if response.status_code == 200:
+            line = json.dumps({'time': time.time(), 'url': url,
+                               'etag': response.headers.get('ETag'),
+                               'last_modified': response.headers.get('Last-Modified'),
+                               'body': response.content.decode('utf-8')})
+            with self.lock:
+                self.file.write(line + '\n')
+                self.file.flush()
+        return response
+
+    def close(self):
+        self.session.close()
+        with self.lock:
+            self.file.close()
+
+
+class ReplaySession:
+    """Serves a recording back on its original timeline, speed times faster
+
+    A request gets the latest response recorded for that URL by the current
+    point in the replay, or a 304 if the caller already has it.
+    """
+
+    def __init__(self, path, speed=1.0, clock=time.time):
+        self.speed = speed
+        self.clock = clock
+        self.responses = {}
+        with open_recording(path, 'r') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        if not records:
+            raise ValueError(f"{path} has no recorded responses")
+        first = min(record['time'] for record in records)
+        for record in sorted(records, key=lambda record: record['time']):
+            self.responses.setdefault(record['url'], []).append(
+                ((record['time'] - first) / speed, record['body'].encode('utf-8')))
+        self.duration = (max(record['time'] for record in records) - first) / speed
+        self.started = clock()
+        self.changes = self.find_changes()
+
+    def changes_until(self, end):
+        """When each score first became available, as (wall time, away score,
+        home score) keyed by (league_key, event id), up to the wall time end"""
+        changes = {}
+        for key, game_changes in self.changes.items():
+            game_changes = [change for change in game_changes if change[0] <= end]
+            if game_changes:
+                changes[key] = game_changes
+        return changes
+
+    def find_changes(self):
+        changes = {}
+        for url, responses in self.responses.items():
+            league_key = league_from_url(url)
+            last = {}
+            for offset, body in responses:
+                for event_id, away, home in game_scores(body):
+                    if last.get(event_id) != (away, home):
+                        last[event_id] = (away, home)
+                        changes.setdefault((league_key, event_id), []).append(
+                            (self.started + offset, away, home))
+        return changes
+
+    def get(self, url, headers=None, timeout=None):
+        responses = self.responses.get(url)
+        if not responses:
+            # A league that wasn't recorded has no games
+            return ReplayResponse(200, b'{"events": []}')
+        elapsed = self.clock() - self.started
+        index = 0
+        while index + 1 < len(responses) and responses[index + 1][0] <= elapsed:
+            index += 1
+        etag = f'"{index}"'
+        if headers and headers.get('If-None-Match') == etag:
+            return ReplayResponse(304, headers={'ETag': etag})
+        return ReplayResponse(200, responses[index][1], {'ETag': etag})
+
+    def close(self):
+        pass
+
+
+class SyntheticSession:
+    """Serves a SyntheticSlate for its league and empty scoreboards for the rest"""
+
+    def __init__(self, slate, clock=time.time):
+        self.slate = slate
+        self.clock = clock
+        self.body = None
+        self.body_version = None
+        self.lock = threading.Lock()
+
+    def changes_until(self, end):
+        """Like ReplaySession.changes_until, including scores nobody has fetched yet"""
+        with self.lock:
+            self.slate.advance(end)
+            return self.slate.changes
+
+    def get(self, url, headers=None, timeout=None):
+        if league_from_url(url) != self.slate.league_key:
+            return ReplayResponse(200, b'{"events": []}')
+        with self.lock:
+            self.slate.advance(self.clock())
+            if self.body_version != self.slate.version:
+                self.body = json.dumps(self.slate.scoreboard).encode('utf-8')
+                self.body_version = self.slate.version
+            etag = f'"{self.slate.version}"'
+            body = self.body
+        if headers and headers.get('If-None-Match') == etag:
+            return ReplayResponse(304, headers={'ETag': etag})
+        return ReplayResponse(200, body, {'ETag': etag})
+
+    def close(self):
+        pass
+
+
+def measure_latency(display, source, duration):
+    """Run the rotation headless and time each score from source to pixels
+
+    Returns the latency of every score change that was drawn, and how many
+    were never drawn before being overtaken by the next score or the end.
+    """
+    drawn = {}
+    draw_games = display.draw_games
+
+    def probe(games):
+        draw_games(games)
+        now = time.time()
+        for game in games:
+            drawn.setdefault((game.league_key, game.id, game.away_score, game.home_score), now)
+
+    display.draw_games = probe
+    display.start_refresh()
+    threading.Thread(target=display.rotate_loop, name='render', daemon=True).start()
+    end = time.time() + duration
+    time.sleep(duration)
+    display.stop_refresh()
+
+    latencies = []
+    missed = 0
+    for (league_key, event_id), changes in source.changes_until(end).items():
+        for changed_at, away, home in changes:
+            if changed_at > end:
+                continue
+            shown_at = drawn.get((league_key, event_id, away, home))
+            if shown_at is None:
+                missed += 1
+            else:
+                latencies.append(max(0.0, shown_at - changed_at))
+    return latencies, missed
+
+
+def make_source(args):
+    if getattr(args, 'recording', None):
+        return ReplaySession(args.recording, args.speed)
+    return SyntheticSession(SyntheticSlate(events=args.games, seed=args.seed,
+                                           scoring_rate=args.scoring_rate, speed=args.speed))
+
+
+def make_display(args, session):
+    from sports_display import SportsScoreDisplay
+    display = SportsScoreDisplay(backend='headless' if args.headless else None, session=session)
+    if args.command != 'record':
+        # Replayed scores must not end up shown as the real ones at the next startup
+        display.score_cache_path = None
+    return display
+
+
+def run_record(args):
+    import requests
+    display = make_display(args, RecordingSession(requests.Session(), args.recording))
+    display.run()
+
+
+def run_play(args):
+    make_display(args, make_source(args)).run()
+
+
+def run_latency(args):
+    args.headless = True
+    source = make_source(args)
+    display = make_display(args, source)
+    print(f"Measuring for {args.duration}s...")
+    latencies, missed = measure_latency(display, source, args.duration)
+    if not latencies:
+        print(f"No score changes were drawn ({missed} missed)")
+        return
+    latencies.sort()
+    print(f"{len(latencies)} score changes drawn, {missed} never drawn")
+    print(f"  latency  mean {sum(latencies) / len(latencies):.1f}s  "
+          f"p50 {latencies[len(latencies) // 2]:.1f}s  "
+          f"p95 {latencies[int(len(latencies) * 0.95)]:.1f}s  max {latencies[-1]:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_display_args(command):
+        command.add_argument('--headless', action='store_true', help='draw to memory instead of the matrix')
+
+    def add_source_args(command, recording):
+        if recording:
+            command.add_argument('recording', nargs='?', help='recorded responses, synthetic if left out')
+        command.add_argument('--speed', type=float, default=1.0, help='replay this many times faster')
+        command.add_argument('--games', type=int, default=150, help='games in the synthetic slate')
+        command.add_argument('--scoring-rate', type=float, default=0.2,
+                             help='synthetic scores per game per minute')
+        command.add_argument('--seed', type=int, default=0)
+
+    record = commands.add_parser('record', help='run the display and save every ESPN response')
+    record.add_argument('recording')
+    add_display_args(record)
+    record.set_defaults(func=run_record)
+
+    play = commands.add_parser('play', help='run the display from a recording')
+    add_source_args(play, recording=True)
+    add_display_args(play)
+    play.set_defaults(func=run_play)
+
+    synthetic = commands.add_parser('synthetic', help='run the display from a synthetic slate')
+    add_source_args(synthetic, recording=False)
+    add_display_args(synthetic)
+    synthetic.set_defaults(func=run_play)
+
+    latency = commands.add_parser('latency', help='score change to pixel latency, headless')
+    add_source_args(latency, recording=True)
+    latency.add_argument('--duration', type=float, default=300, help='seconds to measure for')
+    latency.set_defaults(func=run_latency)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Fetch protection for the Sports Score Display
+Rate limiting and circuit breaking so a failing endpoint is left alone
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, in bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def try_acquire(self):
+        """Take a token if one is available, without waiting"""
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Stops calling an endpoint that keeps failing
+
+    After `threshold` failures in a row the breaker opens and every call is
+    refused for a backoff delay, doubling from base_delay up to max_delay
+    with random jitter so clients don't retry in lockstep. Once the delay is
+    up a single trial call is let through (half open): success closes the
+    breaker, failure opens it again for twice as long.
+    """
+
+    def __init__(self, threshold, base_delay, max_delay, clock=time.monotonic):
+        self.threshold = threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.failures = 0
+        self.open_until = 0.0
+        self.trial = False
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.failures >= self.threshold
+
+    def allow(self):
+        """True if a call may be made now"""
+        with self.lock:
+            if not self.is_open:
+                return True
+            if self.trial or self.clock() < self.open_until:
+                return False
+            self.trial = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.trial = False
+
+    def record_failure(self, retry_after=0):
+        """Count a failure, returns the backoff delay if the breaker opened"""
+        with self.lock:
+            self.failures += 1
+            self.trial = False
+            if not self.is_open:
+                return None
+            backoff = min(self.max_delay, self.base_delay * 2 ** (self.failures - self.threshold))
+            delay = max(retry_after, backoff * random.uniform(0.5, 1.0))
+            self.open_until = self.clock() + delay
+            return delay
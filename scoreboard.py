@@ -0,0 +1,56 @@
+"""
+ESPN scoreboard decoding for the Sports Score Display
+Pulls just the fields the display needs out of a scoreboard payload
+"""
+
+import io
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Every key parse_game_data and the priority matcher read. Everything else
+# (links, logos, leaders, odds, broadcasts, the season calendar...) is
+# dropped while decoding.
+SCOREBOARD_KEYS = frozenset([
+    'events', 'id', 'status', 'type', 'state', 'shortDetail',
+    'competitions', 'competitors', 'team', 'abbreviation', 'displayName', 'score',
+    'shortDisplayName', 'name', 'location',
+])
+
+PARSE_MODES = ('full', 'selective', 'stream')
+
+
+class ScoreboardDict(dict):
+    """dict that silently drops keys the display does not use"""
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        if key in SCOREBOARD_KEYS:
+            dict.__setitem__(self, key, value)
+
+
+def keep_scoreboard_keys(pairs):
+    """object_pairs_hook that only keeps SCOREBOARD_KEYS"""
+    return {key: value for key, value in pairs if key in SCOREBOARD_KEYS}
+
+
+def decode_scoreboard(body, mode='selective'):
+    """Decode a scoreboard response body
+
+    'full' decodes the whole document, like response.json().
+    'selective' decodes with the standard library but drops unused keys as
+    each object is built, so the large subtrees are freed straight away and
+    never pile up.
+    'stream' walks the events one at a time with ijson, so only a single
+    event is ever materialized. It falls back to 'selective' if ijson is not
+    installed.
+    """
+    if mode == 'stream' and ijson is not None:
+        events = list(ijson.items(io.BytesIO(body), 'events.item', map_type=ScoreboardDict))
+        return {'events': events}
+    if mode == 'full':
+        return json.loads(body)
+    return json.loads(body, object_pairs_hook=keep_scoreboard_keys)
@@ -6,227 +6,300 @@ Prioritizes Houston Astros and Arkansas Razorbacks with live score tracking
 Version 2.0 - Team Colors Edition
 """
 
+import hashlib
+import json
+import os
+import threading
 import time
 import requests
+try:
+    import rgbmatrix
+    from rgbmatrix import graphics
+except ImportError:
+    rgbmatrix = None
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
+from requests.adapters import HTTPAdapter
 from config import *
+import headless
+from frame_cache import FrameCache
+from game_store import Game, GameStore, SCORE_CHANGED, game_key, make_game
+from layout import (AWAY_BASELINE, GAME_HEIGHT, HEADER_BASELINE, HOME_BASELINE, PADDING,
+                    STATUS_BASELINE, Layout)
+from metrics import DisplayMetrics, serve
+from scoreboard import decode_scoreboard, ijson
+from polling import PollScheduler
+from priority import PriorityMatcher
+from resilience import CircuitBreaker, TokenBucket
+from team_index import TeamIndex
+import ticker
+
+# Immutable view of the games published by the refresh thread. The render
+# loop only ever reads whole snapshots, so it never sees a half-applied update.
+# stale maps each league that is failing to answer to when it last did.
+GameSnapshot = namedtuple('GameSnapshot', ['games', 'priority_count', 'stale'])
+
+# A score change waiting to be shown: the game's key and when it was fetched
+Highlight = namedtuple('Highlight', ['key', 'detected_at'])
+
+# Returned by fetch_scores when the rate limit skipped the request
+RATE_LIMITED = object()
+
+# Last response seen for a league, used for conditional requests
+CachedResponse = namedtuple('CachedResponse', ['etag', 'last_modified', 'digest', 'data'])
+
+SCORE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), SCORE_CACHE_FILE)
+
+
+# Values a game tile is drawn from; a cached frame is reused while they match
+FrameFields = namedtuple('FrameFields', ['tile', 'league', 'is_priority', 'away_team',
+                                         'home_team', 'away_score', 'home_score', 'status', 'age'])
+
+# Rows (first, last) of a whole game tile
+TILE_ROWS = (0, GAME_HEIGHT - 1)
+# Parts of a game tile, in the order they are drawn
+TILE_PARTS = ('header', 'teams', 'scores', 'status')
+
+
+def age_label(seconds):
+    """Short age for the stale indicator, like 45s, 3m or 2h"""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 60 * 60:
+        return f"{int(seconds // 60)}m"
+    return f"{int(seconds // (60 * 60))}h"
+
+
+def shift_rows(rows, y_offset):
+    """Move a (first, last) row range down by y_offset"""
+    return (rows[0] + y_offset, rows[1] + y_offset)
+
+
+def boxes_overlap(a, b):
+    """True if two (rows, first x, last x) boxes share a pixel"""
+    (a_rows, a_start, a_end), (b_rows, b_start, b_end) = a, b
+    return (a_rows[0] <= b_rows[1] and b_rows[0] <= a_rows[1] and
+            a_start <= b_end and b_start <= a_end)
+
+
+def load_backend(name):
+    """Matrix class, options class and graphics module for a DISPLAY_BACKEND"""
+    if name == 'headless':
+        return headless.RGBMatrix, headless.RGBMatrixOptions, headless
+    if rgbmatrix is None:
+        raise ImportError("rgbmatrix is not installed, set DISPLAY_BACKEND = 'headless' "
+                          "in config.py to run without an LED matrix")
+    return rgbmatrix.RGBMatrix, rgbmatrix.RGBMatrixOptions, graphics
+
+
+def next_deadline(deadline, interval, now):
+    """Advance a fixed-rate deadline, skipping ticks that were missed"""
+    deadline += interval
+    if deadline <= now:
+        deadline = now + interval
+    return deadline
+
 
 class SportsScoreDisplay:
-    def __init__(self):
+    def __init__(self, backend=None, session=None):
         # Configure the matrix from config.py
-        options = RGBMatrixOptions()
+        matrix_class, options_class, self.graphics = load_backend(backend or DISPLAY_BACKEND)
+        options = options_class()
         options.rows = MATRIX_HEIGHT
         options.cols = MATRIX_WIDTH
-        options.chain_length = 1
-        options.parallel = 1
+        options.chain_length = MATRIX_CHAIN_LENGTH
+        options.parallel = MATRIX_PARALLEL
         options.hardware_mapping = MATRIX_HARDWARE_MAPPING
         options.gpio_slowdown = MATRIX_GPIO_SLOWDOWN
         
-        self.matrix = RGBMatrix(options=options)
+        self.matrix = matrix_class(options=options)
+        # Two scratch canvases for uncached frames, so one of them is always
+        # free to draw on whatever is on screen
         self.canvas = self.matrix.CreateFrameCanvas()
+        self.spare_canvas = self.matrix.CreateFrameCanvas()
+        self.front_canvas = None
+        self.frame_cache = FrameCache(self.matrix.CreateFrameCanvas, FRAME_CACHE_SIZE)
         
         # Load fonts from config
-        self.font_large = graphics.Font()
+        self.font_large = self.graphics.Font()
         self.font_large.LoadFont(FONT_LARGE)
         
-        self.font_small = graphics.Font()
+        self.font_small = self.graphics.Font()
         self.font_small.LoadFont(FONT_SMALL)
         
+        # Games per frame and where each one goes, measured from the fonts
+        self.layout = Layout(self.matrix.width, self.matrix.height, self.font_large,
+                             self.font_small, GAME_TILE_WIDTH, MAX_GAMES_PER_FRAME)
+        
         # Colors
-        self.white = graphics.Color(255, 255, 255)
-        self.green = graphics.Color(0, 255, 0)
-        self.red = graphics.Color(255, 0, 0)
-        self.blue = graphics.Color(0, 150, 255)
-        self.yellow = graphics.Color(255, 255, 0)
-        self.orange = graphics.Color(255, 165, 0)
-        self.priority_color = graphics.Color(255, 0, 255)  # Magenta for priority teams
-        
-        # Team colors database (RGB values)
-        self.team_colors = {
-            # MLB
-            'HOU': graphics.Color(235, 110, 37),   # Astros Orange
-            'NYY': graphics.Color(19, 39, 79),      # Yankees Navy
-            'BOS': graphics.Color(189, 48, 57),     # Red Sox Red
-            'LAD': graphics.Color(0, 90, 156),      # Dodgers Blue
-            'ATL': graphics.Color(206, 17, 65),     # Braves Red
-            'CHC': graphics.Color(14, 51, 134),     # Cubs Blue
-            'STL': graphics.Color(196, 30, 58),     # Cardinals Red
-            'SF': graphics.Color(253, 90, 30),      # Giants Orange
-            'LAA': graphics.Color(186, 0, 33),      # Angels Red
-            'SD': graphics.Color(47, 36, 29),       # Padres Brown
-            'TEX': graphics.Color(0, 50, 120),      # Rangers Blue
-            'MIA': graphics.Color(0, 163, 224),     # Marlins Blue
-            'NYM': graphics.Color(0, 45, 114),      # Mets Blue
-            'PHI': graphics.Color(232, 24, 40),     # Phillies Red
-            'WSH': graphics.Color(171, 0, 3),       # Nationals Red
-            'TB': graphics.Color(9, 44, 92),        # Rays Navy
-            'TOR': graphics.Color(19, 74, 142),     # Blue Jays Blue
-            'BAL': graphics.Color(223, 70, 1),      # Orioles Orange
-            'CLE': graphics.Color(0, 56, 93),       # Guardians Navy
-            'DET': graphics.Color(12, 35, 64),      # Tigers Navy
-            'KC': graphics.Color(0, 70, 135),       # Royals Blue
-            'MIN': graphics.Color(0, 43, 92),       # Twins Navy
-            'CWS': graphics.Color(39, 37, 31),      # White Sox Black
-            'OAK': graphics.Color(0, 56, 49),       # Athletics Green
-            'SEA': graphics.Color(12, 44, 86),      # Mariners Navy
-            'MIL': graphics.Color(18, 40, 75),      # Brewers Navy
-            'PIT': graphics.Color(39, 37, 31),      # Pirates Black
-            'CIN': graphics.Color(198, 1, 31),      # Reds Red
-            'COL': graphics.Color(51, 0, 111),      # Rockies Purple
-            'ARI': graphics.Color(167, 25, 48),     # Diamondbacks Red
-            
-            # NFL
-            'KC': graphics.Color(227, 24, 55),      # Chiefs Red
-            'BUF': graphics.Color(0, 51, 141),      # Bills Royal Blue
-            'DAL': graphics.Color(0, 34, 68),       # Cowboys Navy
-            'GB': graphics.Color(24, 48, 40),       # Packers Green
-            'NE': graphics.Color(0, 34, 68),        # Patriots Navy
-            'SF': graphics.Color(170, 0, 0),        # 49ers Red
-            'PHI': graphics.Color(0, 76, 84),       # Eagles Green
-            'PIT': graphics.Color(255, 182, 18),    # Steelers Gold
-            'BAL': graphics.Color(26, 25, 95),      # Ravens Purple
-            'MIN': graphics.Color(79, 38, 131),     # Vikings Purple
-            'LAR': graphics.Color(0, 53, 148),      # Rams Blue
-            'LAC': graphics.Color(0, 128, 198),     # Chargers Blue
-            'MIA': graphics.Color(0, 142, 151),     # Dolphins Aqua
-            'CIN': graphics.Color(251, 79, 20),     # Bengals Orange
-            'DEN': graphics.Color(251, 79, 20),     # Broncos Orange
-            'SEA': graphics.Color(0, 34, 68),       # Seahawks Navy
-            'ATL': graphics.Color(167, 25, 48),     # Falcons Red
-            'NO': graphics.Color(211, 188, 141),    # Saints Gold
-            'TB': graphics.Color(213, 10, 10),      # Buccaneers Red
-            'CAR': graphics.Color(0, 133, 202),     # Panthers Blue
-            'CHI': graphics.Color(11, 22, 42),      # Bears Navy
-            'DET': graphics.Color(0, 118, 182),     # Lions Blue
-            'NYG': graphics.Color(1, 35, 82),       # Giants Blue
-            'NYJ': graphics.Color(18, 87, 64),      # Jets Green
-            'WAS': graphics.Color(90, 20, 20),      # Commanders Burgundy
-            'CLE': graphics.Color(49, 29, 0),       # Browns Brown
-            'TEN': graphics.Color(12, 35, 64),      # Titans Navy
-            'JAX': graphics.Color(0, 103, 120),     # Jaguars Teal
-            'IND': graphics.Color(0, 44, 95),       # Colts Blue
-            'HOU': graphics.Color(3, 32, 47),       # Texans Navy
-            'LV': graphics.Color(0, 0, 0),          # Raiders Black
-            'ARI': graphics.Color(151, 35, 63),     # Cardinals Red
-            
-            # NBA
-            'LAL': graphics.Color(85, 37, 130),     # Lakers Purple
-            'BOS': graphics.Color(0, 122, 51),      # Celtics Green
-            'GSW': graphics.Color(29, 66, 138),     # Warriors Blue
-            'MIA': graphics.Color(152, 0, 46),      # Heat Red
-            'CHI': graphics.Color(206, 17, 65),     # Bulls Red
-            'NYK': graphics.Color(0, 107, 182),     # Knicks Blue
-            'BKN': graphics.Color(0, 0, 0),         # Nets Black
-            'PHI': graphics.Color(0, 107, 182),     # 76ers Blue
-            'TOR': graphics.Color(206, 17, 65),     # Raptors Red
-            'MIL': graphics.Color(0, 71, 27),       # Bucks Green
-            'CLE': graphics.Color(134, 0, 56),      # Cavaliers Wine
-            'IND': graphics.Color(0, 45, 98),       # Pacers Navy
-            'DET': graphics.Color(200, 16, 46),     # Pistons Red
-            'ATL': graphics.Color(225, 68, 52),     # Hawks Red
-            'CHO': graphics.Color(29, 17, 96),      # Hornets Purple
-            'WAS': graphics.Color(0, 43, 92),       # Wizards Navy
-            'ORL': graphics.Color(0, 125, 197),     # Magic Blue
-            'DEN': graphics.Color(13, 34, 64),      # Nuggets Navy
-            'UTA': graphics.Color(0, 43, 92),       # Jazz Navy
-            'POR': graphics.Color(224, 58, 62),     # Trail Blazers Red
-            'OKC': graphics.Color(0, 125, 195),     # Thunder Blue
-            'MIN': graphics.Color(12, 35, 64),      # Timberwolves Navy
-            'PHX': graphics.Color(29, 17, 96),      # Suns Purple
-            'LAC': graphics.Color(200, 16, 46),     # Clippers Red
-            'SAC': graphics.Color(91, 43, 130),     # Kings Purple
-            'DAL': graphics.Color(0, 83, 188),      # Mavericks Blue
-            'HOU': graphics.Color(206, 17, 65),     # Rockets Red
-            'SAS': graphics.Color(196, 206, 211),   # Spurs Silver
-            'NOP': graphics.Color(0, 22, 65),       # Pelicans Navy
-            'MEM': graphics.Color(93, 118, 169),    # Grizzlies Blue
-            
-            # College - Arkansas
-            'ARK': graphics.Color(157, 34, 53),     # Razorbacks Cardinal
-            
-            # College - SEC
-            'ALA': graphics.Color(158, 27, 50),     # Alabama Crimson
-            'UGA': graphics.Color(186, 12, 47),     # Georgia Red
-            'LSU': graphics.Color(70, 29, 124),     # LSU Purple
-            'TENN': graphics.Color(255, 130, 0),    # Tennessee Orange
-            'FLA': graphics.Color(0, 33, 165),      # Florida Blue
-            'TEX': graphics.Color(191, 87, 0),      # Texas Burnt Orange
-            'OKLA': graphics.Color(132, 17, 31),    # Oklahoma Crimson
-            'MISS': graphics.Color(14, 35, 86),     # Ole Miss Navy
-            'MSST': graphics.Color(102, 0, 0),      # Mississippi State Maroon
-            'TAMU': graphics.Color(80, 0, 0),       # Texas A&M Maroon
-            'AU': graphics.Color(12, 35, 64),       # Auburn Navy
-            'MO': graphics.Color(241, 184, 45),     # Missouri Gold
-            'SC': graphics.Color(115, 0, 10),       # South Carolina Garnet
-            'UK': graphics.Color(0, 51, 160),       # Kentucky Blue
-            'VAN': graphics.Color(134, 109, 75),    # Vanderbilt Gold
-            
-            # College - Big Ten
-            'OSU': graphics.Color(187, 0, 0),       # Ohio State Scarlet
-            'MICH': graphics.Color(0, 39, 76),      # Michigan Blue
-            'PSU': graphics.Color(4, 30, 66),       # Penn State Navy
-            'WIS': graphics.Color(197, 5, 12),      # Wisconsin Red
-            'NEB': graphics.Color(208, 0, 0),       # Nebraska Red
-            'IOWA': graphics.Color(255, 205, 0),    # Iowa Gold
-            'MSU': graphics.Color(24, 69, 59),      # Michigan State Green
-            'IND': graphics.Color(153, 0, 0),       # Indiana Crimson
-            'ILL': graphics.Color(19, 41, 75),      # Illinois Navy
-            'PUR': graphics.Color(206, 184, 136),   # Purdue Gold
-            'MINN': graphics.Color(122, 0, 25),     # Minnesota Maroon
-            'NW': graphics.Color(78, 42, 132),      # Northwestern Purple
-            'MD': graphics.Color(224, 58, 62),      # Maryland Red
-            'RUT': graphics.Color(204, 0, 51),      # Rutgers Scarlet
-        
-            # College - ACC & Others
-            'DUKE': graphics.Color(0, 26, 87),      # Duke Blue
-            'UNC': graphics.Color(123, 175, 212),   # UNC Carolina Blue
-            'CLEM': graphics.Color(246, 103, 51),   # Clemson Orange
-            'FSU': graphics.Color(120, 47, 64),     # Florida State Garnet
-            'ND': graphics.Color(12, 35, 64),       # Notre Dame Navy
-            'USC': graphics.Color(153, 27, 30),     # USC Cardinal
-            'UCLA': graphics.Color(39, 116, 174),   # UCLA Blue
-            'ORE': graphics.Color(18, 71, 52),      # Oregon Green
-            'WASH': graphics.Color(51, 0, 111),     # Washington Purple
-            'KU': graphics.Color(0, 81, 186),       # Kansas Blue
-            'GONZ': graphics.Color(4, 30, 66),      # Gonzaga Navy
-            'VILL': graphics.Color(0, 32, 91),      # Villanova Navy
-        }
+        self.white = self.graphics.Color(255, 255, 255)
+        self.green = self.graphics.Color(0, 255, 0)
+        self.red = self.graphics.Color(255, 0, 0)
+        self.blue = self.graphics.Color(0, 150, 255)
+        self.yellow = self.graphics.Color(255, 255, 0)
+        self.orange = self.graphics.Color(255, 165, 0)
+        self.black = self.graphics.Color(0, 0, 0)
+        self.priority_color = self.graphics.Color(255, 0, 255)  # Magenta for priority teams
+        
+        # Team colors, looked up per league from teams/*.json
+        self.teams = TeamIndex(self.graphics.Color, {c['league']: c.get('teams', c['league'])
+                                                for c in SPORTS_CONFIG})
+        
+        self.priority = PriorityMatcher(PRIORITY_TEAMS, PRIORITY_TEAM_PATTERNS)
+        
+        # Ticker mode state, the strip is built on the first frame
+        self.ticker = None
+        self.ticker_strip = None
+        self.ticker_panels = ()
+        self.ticker_pinned = None
+        self.ticker_flash = None
+        if DISPLAY_MODE == 'ticker':
+            if ticker.Image is None:
+                print("DISPLAY_MODE 'ticker' needs PIL (sudo apt install python3-pil), using 'rotate'")
+            else:
+                self.ticker = ticker.TickerRenderer(self.matrix.height, FONT_LARGE, FONT_SMALL,
+                                                    TICKER_FONT_LARGE_SIZE, TICKER_FONT_SMALL_SIZE,
+                                                    self.team_rgb)
         
         self.scroll_pos = 0
-        self.current_games = []
-        self.priority_games = []
-        self.last_priority_scores = {}
+        self.store = GameStore()
+        self.store.subscribe(self.on_game_events)
+        
+        # Published by the refresh thread, read by the render loop
+        self.snapshot = GameSnapshot((), 0, {})
+        self.snapshot_ready = threading.Event()
+        # Score changes to show straight away, queued once their snapshot is out
+        self.score_changed = threading.Event()
+        self.pending_highlights = []
+        self.highlights = deque()
+        self.stop_event = threading.Event()
+        self.refresh_thread = None
+        self.poller = PollScheduler({c['league']: c['sport'] for c in SPORTS_CONFIG},
+                                    FULL_UPDATE_INTERVAL, PRE_GAME_POLL_INTERVAL,
+                                    BREAK_POLL_INTERVAL, CLOSE_GAME_POLL_INTERVAL,
+                                    IDLE_POLL_INTERVAL, BREAK_STATUS_PATTERN, CLOSE_GAME_RULES)
+        
+        # Per-league response cache and the games parsed from each response
+        self.response_cache = {}
+        self.parsed_games = {}
+        self.saved_games = None
+        # Where scores are saved between runs, None to not save them
+        self.score_cache_path = SCORE_CACHE_PATH
+        
+        # Per-league rate limits and circuit breakers, when each league last
+        # answered, and the leagues whose last refresh failed
+        self.rate_limits = {c['league']: TokenBucket(FETCH_RATE_LIMIT, FETCH_BURST)
+                            for c in SPORTS_CONFIG}
+        self.breakers = {c['league']: CircuitBreaker(FETCH_FAILURE_THRESHOLD, FETCH_BACKOFF,
+                                                     FETCH_MAX_BACKOFF)
+                         for c in SPORTS_CONFIG}
+        self.fetched_at = {}
+        self.failing = set()
+        
+        self.metrics = DisplayMetrics()
+        self.metrics.on_collect(self.collect_metrics)
+        
+        if PARSE_MODE == 'stream' and ijson is None:
+            print("PARSE_MODE 'stream' needs the ijson package, using 'selective'")
+        
+        # Shared keep-alive connection pool and worker threads so every
+        # league is fetched at once instead of one after another. A session
+        # can be passed in to replay recorded or synthetic feeds instead.
+        workers = max(1, len(SPORTS_CONFIG))
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.executor = ThreadPoolExecutor(max_workers=workers,
+                                           thread_name_prefix='fetch')
         
     def fetch_scores(self, sport, league):
-        """Fetch live scores from ESPN API"""
+        """Fetch live scores from ESPN API
+        
+        Sends a conditional request when the last response had an ETag or
+        Last-Modified header. If the scoreboard has not changed (a 304, or a
+        body with the same hash) the previously decoded object is returned
+        as is, so callers can tell nothing changed with an identity check.
+        
+        Requests are rate limited per league; over the limit RATE_LIMITED is
+        returned without a request. A league that keeps failing is backed off
+        by its circuit breaker, and None is returned without a request until
+        the backoff is over.
+        """
         url = f"http://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard"
+        cached = self.response_cache.get(league)
+        breaker = self.breakers[league]
+        if not self.rate_limits[league].try_acquire():
+            self.metrics.fetch_requests.inc(league=league, result='rate_limited')
+            return RATE_LIMITED
+        if not breaker.allow():
+            self.metrics.fetch_requests.inc(league=league, result='backoff')
+            return None
+        
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        
+        retry_after = 0
+        start = time.perf_counter()
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, headers=headers,
+                                        timeout=(FETCH_CONNECT_TIMEOUT, FETCH_TIMEOUT))
+            self.metrics.fetch_seconds.observe(time.perf_counter() - start, league=league)
+            self.metrics.fetch_bytes.inc(len(response.content), league=league)
+            if response.status_code == 304 and cached:
+                self.metrics.fetch_requests.inc(league=league, result='not_modified')
+                breaker.record_success()
+                return cached.data
             if response.status_code == 200:
-                return response.json()
+                digest = hashlib.sha1(response.content).digest()
+                if cached and cached.digest == digest:
+                    self.metrics.fetch_requests.inc(league=league, result='unchanged')
+                    data = cached.data
+                else:
+                    self.metrics.fetch_requests.inc(league=league, result='ok')
+                    start = time.perf_counter()
+                    data = decode_scoreboard(response.content, PARSE_MODE)
+                    self.metrics.decode_seconds.observe(time.perf_counter() - start, league=league)
+                self.response_cache[league] = CachedResponse(response.headers.get('ETag'),
+                                                             response.headers.get('Last-Modified'),
+                                                             digest, data)
+                breaker.record_success()
+                return data
+            print(f"Error fetching {league}: HTTP {response.status_code}")
+            retry_after = response.headers.get('Retry-After', '')
+            retry_after = int(retry_after) if retry_after.isdigit() else 0
         except Exception as e:
             print(f"Error fetching {league}: {e}")
+        
+        self.metrics.fetch_requests.inc(league=league, result='error')
+        delay = breaker.record_failure(retry_after)
+        if delay is not None:
+            print(f"Backing off {league} for {delay:.0f}s after {breaker.failures} failures")
         return None
     
-    def is_priority_team(self, team_name, league):
-        """Check if a team is in the priority list"""
-        if league not in PRIORITY_TEAMS:
-            return False
-        
-        priority_names = PRIORITY_TEAMS[league]
-        for priority in priority_names:
-            if priority.lower() in team_name.lower():
-                return True
-        return False
+    def is_priority_team(self, team, league):
+        """Check if a competitor's team is in the priority list"""
+        return self.priority.matches(league, team)
     
-    def parse_game_data(self, data, league_name, league_key):
-        """Parse game data into displayable format"""
+    def parse_game_data(self, data, league_name, league_key, event_ids=None):
+        """Parse game data into displayable format
+        
+        If event_ids is given, every other event is skipped before parsing.
+        """
         games = []
         if not data or 'events' not in data:
             return games
             
         for event in data['events']:
+            if event_ids is not None and event.get('id') not in event_ids:
+                continue
             try:
                 status = event.get('status', {})
                 state = status.get('type', {}).get('state', '')
@@ -242,28 +315,11 @@ class SportsScoreDisplay:
                     home = competitors[1]
                     away = competitors[0]
                     
-                    home_team_name = home.get('team', {}).get('displayName', '')
-                    away_team_name = away.get('team', {}).get('displayName', '')
-                    
-                    is_priority = (self.is_priority_team(home_team_name, league_key) or 
-                                 self.is_priority_team(away_team_name, league_key))
+                    is_priority = (self.is_priority_team(home.get('team', {}), league_key) or
+                                   self.is_priority_team(away.get('team', {}), league_key))
                     
-                    game_id = event.get('id', '')
-                    
-                    game = {
-                        'id': game_id,
-                        'league': league_name,
-                        'league_key': league_key,
-                        'away_team': away.get('team', {}).get('abbreviation', 'TBD')[:4],
-                        'home_team': home.get('team', {}).get('abbreviation', 'TBD')[:4],
-                        'away_score': away.get('score', '0'),
-                        'home_score': home.get('score', '0'),
-                        'status': detail,
-                        'state': state,
-                        'is_priority': is_priority,
-                        'away_full_name': away_team_name,
-                        'home_full_name': home_team_name
-                    }
+                    game = make_game(event.get('id', ''), league_name, league_key,
+                                     away, home, detail, state, is_priority)
                     games.append(game)
             except Exception as e:
                 print(f"Error parsing game: {e}")
@@ -271,146 +327,742 @@ class SportsScoreDisplay:
                 
         return games
     
-    def get_all_games(self):
-        """Fetch all sports scores"""
-        all_games = []
-        priority_games = []
+    def parse_league(self, sport_config, data, event_ids=None):
+        """Parse a league's scoreboard, reusing the last result if it is unchanged"""
+        league_key = sport_config['league']
+        cached = self.parsed_games.get(league_key)
+        if cached and cached[0] is data:
+            games = cached[1]
+            if event_ids is not None:
+                games = [game for game in games if game.id in event_ids]
+            return games
         
-        for sport_config in SPORTS_CONFIG:
-            data = self.fetch_scores(sport_config['sport'], sport_config['league'])
-            games = self.parse_game_data(data, sport_config['name'], sport_config['league'])
-            
-            for game in games:
-                if game['is_priority']:
-                    priority_games.append(game)
-                else:
-                    all_games.append(game)
+        start = time.perf_counter()
+        games = self.parse_game_data(data, sport_config['name'], league_key, event_ids)
+        self.metrics.parse_seconds.observe(time.perf_counter() - start, league=league_key)
+        if event_ids is None:
+            self.parsed_games[league_key] = (data, games)
+        return games
+    
+    def fetch_all_scores(self, sport_configs):
+        """Fetch several leagues concurrently
+        
+        Every league shares one deadline, so a refresh takes about as long as
+        the slowest league rather than the sum of all of them. Leagues that
+        miss the deadline or fail are left out of the result (partial results).
+        """
+        futures = {}
+        for sport_config in sport_configs:
+            future = self.executor.submit(self.fetch_scores, sport_config['sport'],
+                                          sport_config['league'])
+            futures[future] = sport_config
+        
+        done, not_done = wait(futures, timeout=FETCH_DEADLINE)
+        for future in not_done:
+            # The worker finishes on its own once the request times out
+            print(f"Timed out fetching {futures[future]['league']}")
         
-        return priority_games, all_games
+        results = []
+        for future, sport_config in futures.items():
+            if future in done:
+                data = future.result()
+                if data is not None:
+                    results.append((sport_config, data))
+        return results
     
-    def check_priority_score_changes(self):
-        """Check if any priority game scores have changed"""
-        if not self.priority_games:
-            return False
+    def fetch_games(self, sport_configs, event_ids=None):
+        """Fetch and parse several leagues
         
-        changed = False
-        for game in self.priority_games:
-            game_id = game['id']
-            current_score = f"{game['away_score']}-{game['home_score']}"
-            
-            if game_id in self.last_priority_scores:
-                if self.last_priority_scores[game_id] != current_score:
-                    print(f"Score changed for {game['away_team']} @ {game['home_team']}: {current_score}")
-                    changed = True
-            
-            self.last_priority_scores[game_id] = current_score
+        Returns the games and the set of leagues that actually answered.
+        event_ids ({league_key: set of ids}) limits parsing to those events.
+        A rate limited league neither answered nor failed, so its games and
+        its age are left as they were.
+        """
+        games = []
+        league_keys = set()
+        limited = set()
+        for sport_config, data in self.fetch_all_scores(sport_configs):
+            league_key = sport_config['league']
+            if data is RATE_LIMITED:
+                limited.add(league_key)
+                continue
+            league_keys.add(league_key)
+            ids = event_ids[league_key] if event_ids is not None else None
+            games.extend(self.parse_league(sport_config, data, ids))
         
-        return changed
+        now = time.time()
+        for sport_config in sport_configs:
+            league_key = sport_config['league']
+            if league_key in league_keys:
+                self.fetched_at[league_key] = now
+                self.failing.discard(league_key)
+            elif league_key not in limited:
+                self.failing.add(league_key)
+        return games, league_keys
     
-    def draw_game(self, game, y_offset=0):
-        """Draw a single game on the matrix"""
-        self.canvas.Clear()
+    def priority_event_ids(self):
+        """Ids of the priority games in progress, by league
         
-        league_color = self.priority_color if game['is_priority'] else self.blue
-        graphics.DrawText(self.canvas, self.font_small, 2, 8 + y_offset, 
-                         league_color, game['league'])
+        Games that haven't started or are at halftime are left to the
+        league's own, slower, polling.
+        """
+        event_ids = {}
+        for game in self.store.priority_games():
+            if self.poller.is_active(game):
+                event_ids.setdefault(game.league_key, set()).add(game.id)
+        return event_ids
+    
+    def on_game_events(self, events):
+        """React to changes applied to the game store"""
+        for event in events:
+            game = event.game
+            if event.kind != SCORE_CHANGED:
+                continue
+            if game.is_priority:
+                print(f"Score changed for {game.away_team} @ {game.home_team}: "
+                      f"{game.away_score}-{game.home_score}")
+            if SCORE_HIGHLIGHT == 'all' or (SCORE_HIGHLIGHT == 'priority' and game.is_priority):
+                self.pending_highlights.append(Highlight(game_key(game), time.monotonic()))
+    
+    def take_highlight(self):
+        """The oldest score change waiting to be shown, or None"""
+        self.score_changed.clear()
+        if not self.highlights:
+            return None
+        highlight = self.highlights.popleft()
+        if self.highlights:
+            # Show the next one straight after
+            self.score_changed.set()
+        return highlight
+    
+    def record_highlight(self, game, highlight):
+        """Note how long a score change took to reach the matrix"""
+        latency = time.monotonic() - highlight.detected_at
+        self.metrics.score_change_seconds.observe(latency)
+        print(f"Showing {game.away_team} {game.away_score} @ {game.home_team} "
+              f"{game.home_score} {latency * 1000:.0f}ms after the score was fetched")
+    
+    def present(self, canvas):
+        """Swap a fully drawn canvas onto the matrix"""
+        start = time.perf_counter()
+        self.matrix.SwapOnVSync(canvas)
+        self.metrics.swap_seconds.observe(time.perf_counter() - start)
+        self.front_canvas = canvas
+        if canvas is self.canvas:
+            # The scratch canvas is on screen now, draw on the other one next
+            self.canvas, self.spare_canvas = self.spare_canvas, self.canvas
+    
+    def fill_rows(self, canvas, rows, x_start, x_end, color):
+        """Fill part of a canvas, rows is (first, last)"""
+        for y in range(rows[0], rows[1] + 1):
+            self.graphics.DrawLine(canvas, x_start, y, x_end, y, color)
+    
+    def clear_rows(self, canvas, rows, x_start=0, x_end=None):
+        """Blank part of a canvas, rows is (first, last)"""
+        if x_end is None:
+            x_end = canvas.width - 1
+        self.fill_rows(canvas, rows, x_start, x_end, self.black)
+    
+    def fill_scores(self, canvas, tile, color):
+        """Fill behind both scores of a tile, on the rows no other line uses"""
+        score_x = tile.x + self.layout.score_x
+        self.fill_rows(canvas, shift_rows(self.layout.score_block_rows, tile.y), score_x,
+                       score_x + self.layout.score_width, color)
+    
+    def part_boxes(self, tile):
+        """Where each part of a tile can draw, as (rows, first x, last x)"""
+        score_x = tile.x + self.layout.score_x
+        last_x = tile.x + tile.width - 1
+        score_rows = shift_rows(self.layout.score_rows, tile.y)
+        return {
+            'header': (shift_rows(self.layout.header_rows, tile.y), tile.x, last_x),
+            'teams': (score_rows, tile.x, score_x - 1),
+            'scores': (score_rows, score_x, score_x + self.layout.score_width),
+            'status': (shift_rows(self.layout.status_rows, tile.y), tile.x, last_x),
+        }
+    
+    def clear_tile(self, canvas, tile, rows=TILE_ROWS):
+        """Blank rows of a single tile"""
+        self.clear_rows(canvas, shift_rows(rows, tile.y), tile.x, tile.x + tile.width - 1)
+    
+    def stale_age(self, game, now=None):
+        """Age label for a game whose league has stopped answering, else None
         
-        if game['is_priority']:
-            graphics.DrawText(self.canvas, self.font_small, 35, 8 + y_offset, 
+        The last known scores keep being shown while a league is failing;
+        once they are older than STALE_SCORE_AGE this says how old.
+        """
+        fetched_at = self.snapshot.stale.get(game.league_key)
+        if fetched_at is None:
+            return None
+        age = (now or time.time()) - fetched_at
+        return age_label(age) if age >= STALE_SCORE_AGE else None
+    
+    def status_text(self, game, tile, age=None):
+        """As much of the game status as fits in the tile, next to the age"""
+        width = tile.width - 2 * PADDING
+        if age:
+            width -= self.layout.text_width(self.layout.small, ' ' + age)
+        return self.layout.fit(self.layout.small, game.status[:20], width)
+    
+    def frame_fields(self, game, tile):
+        """The FrameFields a game would be drawn with"""
+        age = self.stale_age(game)
+        return FrameFields(tile, game.league, game.is_priority, game.away_team,
+                           game.home_team, game.away_score, game.home_score,
+                           self.status_text(game, tile, age), age)
+    
+    def draw_header(self, canvas, game, tile):
+        """League name, with a star for priority games"""
+        league_color = self.priority_color if game.is_priority else self.blue
+        self.graphics.DrawText(canvas, self.font_small, tile.x + PADDING, tile.y + HEADER_BASELINE, 
+                         league_color, game.league)
+        
+        if game.is_priority:
+            star_x = tile.x + PADDING + self.layout.text_width(self.layout.small, game.league + ' ')
+            self.graphics.DrawText(canvas, self.font_small, star_x, tile.y + HEADER_BASELINE, 
                              self.yellow, "★")
+    
+    def draw_teams(self, canvas, game, tile):
+        """Team abbreviations in team colors"""
+        away_team_color = self.teams.color(game.league_key, game.away_team, self.white)
+        home_team_color = self.teams.color(game.league_key, game.home_team, self.white)
+        self.graphics.DrawText(canvas, self.font_large, tile.x + PADDING, tile.y + AWAY_BASELINE, 
+                         away_team_color, game.away_team)
+        self.graphics.DrawText(canvas, self.font_large, tile.x + PADDING, tile.y + HOME_BASELINE, 
+                         home_team_color, game.home_team)
+    
+    def draw_scores(self, canvas, game, tile):
+        """Both scores, the leader in green"""
+        score_x = tile.x + self.layout.score_x
+        away_score_color = self.green if game.away_score > game.home_score else self.white
+        self.graphics.DrawText(canvas, self.font_large, score_x, tile.y + AWAY_BASELINE, 
+                         away_score_color, str(game.away_score))
+        home_score_color = self.green if game.home_score > game.away_score else self.white
+        self.graphics.DrawText(canvas, self.font_large, score_x, tile.y + HOME_BASELINE, 
+                         home_score_color, str(game.home_score))
+    
+    def draw_status(self, canvas, game, tile, age=None):
+        """Game clock, inning or start time, and how old it is if the league is failing"""
+        self.graphics.DrawText(canvas, self.font_small, tile.x + PADDING, tile.y + STATUS_BASELINE, 
+                         self.yellow, self.status_text(game, tile, age))
+        if age:
+            age_x = tile.x + tile.width - PADDING - self.layout.text_width(self.layout.small, age)
+            self.graphics.DrawText(canvas, self.font_small, age_x, tile.y + STATUS_BASELINE, 
+                             self.orange, age)
+    
+    def render_game(self, canvas, game, tile, age=None):
+        """Draw every part of a game onto a blank tile"""
+        self.draw_header(canvas, game, tile)
+        self.draw_teams(canvas, game, tile)
+        self.draw_scores(canvas, game, tile)
+        self.draw_status(canvas, game, tile, age)
+    
+    def redraw_game(self, canvas, old, game, new):
+        """Redraw only the parts of a tile whose fields changed"""
+        tile = new.tile
+        if old.tile != tile or old.away_team != new.away_team or old.home_team != new.home_team:
+            self.clear_tile(canvas, tile)
+            self.render_game(canvas, game, tile, new.age)
+            return
         
-        away_team_color = self.team_colors.get(game['away_team'], self.white)
-        home_team_color = self.team_colors.get(game['home_team'], self.white)
+        changed = set()
+        if old.league != new.league or old.is_priority != new.is_priority:
+            changed.add('header')
+        if old.away_score != new.away_score or old.home_score != new.home_score:
+            # Both scores, the leader is highlighted
+            changed.add('scores')
+        if old.status != new.status or old.age != new.age:
+            changed.add('status')
         
-        try:
-            away_int = int(game['away_score'])
-            home_int = int(game['home_score'])
-        except:
-            away_int = 0
-            home_int = 0
-        
-        graphics.DrawText(self.canvas, self.font_large, 2, 17 + y_offset, 
-                         away_team_color, game['away_team'])
-        away_score_color = self.green if away_int > home_int else self.white
-        graphics.DrawText(self.canvas, self.font_large, 32, 17 + y_offset, 
-                         away_score_color, game['away_score'])
-        
-        graphics.DrawText(self.canvas, self.font_large, 2, 25 + y_offset, 
-                         home_team_color, game['home_team'])
-        home_score_color = self.green if home_int > away_int else self.white
-        graphics.DrawText(self.canvas, self.font_large, 32, 25 + y_offset, 
-                         home_score_color, game['home_score'])
-        
-        status_text = game['status'][:20]
-        graphics.DrawText(self.canvas, self.font_small, 2, 32 + y_offset, 
-                         self.yellow, status_text)
-        
-        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        boxes = self.part_boxes(tile)
+        for part in changed:
+            rows, x_start, x_end = boxes[part]
+            self.clear_rows(canvas, rows, x_start, x_end)
+        
+        # Lines overlap when the fonts are tall, so clearing one part can cut
+        # into another. Text only ever sets pixels, so every part touching a
+        # cleared box is drawn again whole, as is any part drawn after one of
+        # those that it overlaps. In render order that leaves the tile exactly
+        # as a full render would.
+        cleared = [boxes[part] for part in changed]
+        redraw = set()
+        for i, part in enumerate(TILE_PARTS):
+            if (any(boxes_overlap(boxes[part], box) for box in cleared) or
+                    any(boxes_overlap(boxes[part], boxes[earlier])
+                        for earlier in TILE_PARTS[:i] if earlier in redraw)):
+                redraw.add(part)
+        
+        draw = {'header': self.draw_header, 'teams': self.draw_teams, 'scores': self.draw_scores,
+                'status': lambda canvas, game, tile: self.draw_status(canvas, game, tile, new.age)}
+        for part in TILE_PARTS:
+            if part in redraw:
+                draw[part](canvas, game, tile)
+    
+    def draw_games(self, games):
+        """Draw a frame of games on the matrix, one per layout tile
+        
+        Frames are cached per set of games. When the same games come round
+        again only the tiles, and the parts of them, that changed are
+        redrawn, and nothing at all if they are unchanged.
+        """
+        start = time.perf_counter()
+        key = tuple(game_key(game) for game in games)
+        fields = tuple(self.frame_fields(game, tile) for game, tile in zip(games, self.layout.tiles))
+        frame = self.frame_cache.get(key)
+        
+        if frame is not None and frame.canvas is self.front_canvas:
+            if frame.fields == fields:
+                return
+            # Never draw on the canvas that is on screen
+            frame = None
+        
+        if frame is None:
+            frame = self.frame_cache.acquire(key, fields, busy=self.front_canvas)
+            for game, game_fields in zip(games, fields):
+                self.render_game(frame.canvas, game, game_fields.tile, game_fields.age)
+        elif frame.fields != fields:
+            for game, old, new in zip(games, frame.fields, fields):
+                if old != new:
+                    self.redraw_game(frame.canvas, old, game, new)
+            frame.fields = fields
+        
+        self.metrics.render_seconds.observe(time.perf_counter() - start, mode='rotate')
+        self.present(frame.canvas)
+    
+    def draw_game(self, game):
+        """Draw a single game on the matrix, in the first tile"""
+        self.draw_games((game,))
+    
+    def draw_score_flash(self, canvas, game, tile):
+        """Both scores in black on a yellow block, over a fully drawn tile"""
+        score_x = tile.x + self.layout.score_x
+        self.fill_scores(canvas, tile, self.yellow)
+        self.graphics.DrawText(canvas, self.font_large, score_x, tile.y + AWAY_BASELINE, 
+                         self.black, str(game.away_score))
+        self.graphics.DrawText(canvas, self.font_large, score_x, tile.y + HOME_BASELINE, 
+                         self.black, str(game.home_score))
+        # Lines drawn after the scores stay on top of them, as in a normal frame
+        boxes = self.part_boxes(tile)
+        if boxes_overlap(boxes['status'], boxes['scores']):
+            self.draw_status(canvas, game, tile, self.stale_age(game))
+    
+    def show_score_change(self, page, highlight):
+        """Put up a page with a new score straight away, then blink the score
+        
+        The blinks are drawn on the scratch canvas, so the cached frame for
+        the page stays clean and comes straight back between them. They stop
+        early if another score changes, so a burst of scores doesn't queue up.
+        """
+        self.draw_games(page)
+        index = [game_key(game) for game in page].index(highlight.key)
+        game = page[index]
+        tile = self.layout.tiles[index]
+        self.record_highlight(game, highlight)
+        
+        for _ in range(SCORE_FLASH_COUNT):
+            if self.score_changed.wait(SCORE_FLASH_TIME):
+                return
+            canvas = self.canvas
+            canvas.Clear()
+            for page_game, page_tile in zip(page, self.layout.tiles):
+                self.render_game(canvas, page_game, page_tile, self.stale_age(page_game))
+            self.draw_score_flash(canvas, game, tile)
+            self.present(canvas)
+            self.score_changed.wait(SCORE_FLASH_TIME)
+            self.draw_games(page)
+    
+    def pages(self, games):
+        """Split games into the frames the rotation shows"""
+        per_frame = self.layout.games_per_frame
+        return [games[i:i + per_frame] for i in range(0, len(games), per_frame)]
+    
+    def team_rgb(self, league_key, abbreviation):
+        """Team color as an (r, g, b) tuple, or None"""
+        color = self.teams.color(league_key, abbreviation)
+        if color is None:
+            return None
+        return (color.red, color.green, color.blue)
+    
+    def update_ticker(self, snapshot):
+        """Re-render the ticker images for a new snapshot, or new stale ages
+        
+        Only happens when the games change, never per frame.
+        """
+        now = time.time()
+        priority = snapshot.games[:snapshot.priority_count]
+        others = snapshot.games[snapshot.priority_count:]
+        pinned_width = TICKER_PINNED_WIDTH if priority else 0
+        if not pinned_width:
+            # Nothing to pin, everything scrolls
+            others = snapshot.games
+        
+        pinned = (priority, tuple(self.stale_age(game, now) for game in priority))
+        if pinned != self.ticker_pinned:
+            self.ticker_pinned = pinned
+            self.ticker_panels = tuple(self.ticker.render_panel(game, pinned_width, age)
+                                       for game, age in zip(*pinned)) if pinned_width else ()
+        
+        window_width = self.matrix.width - pinned_width
+        if self.ticker_strip is None or self.ticker_strip.window_width != window_width:
+            self.ticker_strip = ticker.TickerStrip(self.ticker, window_width)
+        self.ticker_strip.update(others, [self.stale_age(game, now) for game in others])
+    
+    def draw_ticker_frame(self, now):
+        """Copy the pinned game and the visible part of the strip to the matrix"""
+        start = time.perf_counter()
+        canvas = self.canvas
+        x = 0
+        if self.ticker_panels:
+            # Take turns when more than one priority game is on
+            turn = int(now / PRIORITY_GAME_DISPLAY_TIME) % len(self.ticker_panels)
+            panel = self.ticker_panels[turn]
+            if self.ticker_flash:
+                # A priority game that just scored holds the panel, blinking at first
+                turn, started = self.ticker_flash
+                elapsed = now - started
+                if elapsed < PRIORITY_GAME_DISPLAY_TIME and turn < len(self.ticker_panels):
+                    panel = self.ticker_panels[turn]
+                    blink = int(elapsed / SCORE_FLASH_TIME)
+                    if blink < 2 * SCORE_FLASH_COUNT and blink % 2:
+                        panel = self.ticker.flash(panel)
+                else:
+                    self.ticker_flash = None
+            canvas.SetImage(panel, 0, 0)
+            x = panel.width
+        canvas.SetImage(self.ticker_strip.window(self.scroll_pos), x, 0)
+        self.metrics.render_seconds.observe(time.perf_counter() - start, mode='ticker')
+        self.present(canvas)
+    
+    def show_ticker_score_change(self, highlight, now):
+        """Pin a priority game that just scored, or scroll straight to any other
+        
+        Returns the game, or None if it is no longer on the ticker.
+        """
+        if self.ticker_panels:
+            for turn, game in enumerate(self.ticker_pinned[0]):
+                if game_key(game) == highlight.key:
+                    self.ticker_flash = (turn, now)
+                    return game
+        position = self.ticker_strip.position(highlight.key)
+        if position is None:
+            return None
+        self.scroll_pos = position
+        for game in self.ticker_strip.games:
+            if game_key(game) == highlight.key:
+                return game
     
     def draw_no_games(self):
         """Display message when no games are active"""
         self.canvas.Clear()
-        graphics.DrawText(self.canvas, self.font_large, 10, 16, 
+        self.graphics.DrawText(self.canvas, self.font_large, 10, 16, 
                          self.blue, "NO LIVE GAMES")
-        graphics.DrawText(self.canvas, self.font_small, 15, 28, 
+        self.graphics.DrawText(self.canvas, self.font_small, 15, 28, 
                          self.white, datetime.now().strftime("%H:%M"))
-        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        self.present(self.canvas)
     
-    def run(self):
-        """Main display loop with priority team monitoring"""
-        print("Starting Sports Score Display v2.0...")
-        print(f"Priority Teams configured: {len(PRIORITY_TEAMS)} leagues")
-        game_index = 0
-        update_counter = 0
-        priority_check_counter = 0
+    def publish_snapshot(self):
+        """Hand the current games to the render loop"""
+        games = self.store.ordered_games()
+        priority_count = sum(1 for game in games if game.is_priority)
+        stale = {league_key: self.fetched_at.get(league_key, 0) for league_key in self.failing}
+        self.snapshot = GameSnapshot(tuple(games), priority_count, stale)
+        self.snapshot_ready.set()
+        if self.pending_highlights:
+            # Only signal once the snapshot with the new score is visible
+            self.highlights.extend(self.pending_highlights)
+            self.pending_highlights = []
+            self.score_changed.set()
+    
+    def load_saved_games(self):
+        """Load the games saved by a previous run so they show at startup"""
+        if not self.score_cache_path:
+            return
+        try:
+            with open(self.score_cache_path) as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error loading saved scores: {e}")
+            return
         
+        age = time.time() - saved.get('saved_at', 0)
+        if age > SCORE_CACHE_MAX_AGE:
+            return
+        
+        try:
+            self.store.load([Game._make(row) for row in saved.get('games', [])])
+        except TypeError:
+            print("Ignoring saved scores from an older version")
+            return
+        self.saved_games = self.store.ordered_games()
+        # Shown as stale until each league answers
+        for game in self.saved_games:
+            self.fetched_at[game.league_key] = saved['saved_at']
+            self.failing.add(game.league_key)
+        self.publish_snapshot()
+        print(f"Loaded {len(self.saved_games)} saved games ({int(age)}s old)")
+    
+    def save_games(self):
+        """Persist the last good set of games for the next startup"""
+        games = list(self.snapshot.games)
+        if not self.score_cache_path or games == self.saved_games:
+            return
+        
+        temp_path = self.score_cache_path + '.tmp'
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'saved_at': time.time(), 'games': games}, f)
+            os.replace(temp_path, self.score_cache_path)
+            self.saved_games = games
+        except Exception as e:
+            print(f"Error saving scores: {e}")
+    
+    def refresh_leagues(self, sport_configs):
+        """Refresh some leagues, returns the set of leagues that answered"""
+        print(f"Score refresh of {', '.join(c['name'] for c in sport_configs)}... {datetime.now()}")
+        start = time.perf_counter()
+        games, league_keys = self.fetch_games(sport_configs)
+        self.store.apply(games, league_keys)
+        self.publish_snapshot()
+        print(f"Found {self.snapshot.priority_count} priority games, "
+              f"{len(self.snapshot.games) - self.snapshot.priority_count} other games")
+        self.save_games()
+        self.metrics.refresh_seconds.observe(time.perf_counter() - start, kind='leagues')
+        return league_keys
+    
+    def refresh_due(self):
+        """Refresh the leagues that are due and schedule their next poll
+        
+        The next poll is scheduled even if the refresh raises, as a retry,
+        so a league that keeps raising isn't polled in a tight loop.
+        """
+        due = self.poller.due(time.monotonic())
+        if not due:
+            return
+        answered = set()
         try:
-            while True:
-                if update_counter % FULL_UPDATE_INTERVAL == 0:
-                    print(f"Full score refresh... {datetime.now()}")
-                    self.priority_games, other_games = self.get_all_games()
-                    self.current_games = self.priority_games + other_games
-                    print(f"Found {len(self.priority_games)} priority games, {len(other_games)} other games")
+            answered = self.refresh_leagues([c for c in SPORTS_CONFIG if c['league'] in due])
+        finally:
+            now = time.monotonic()
+            for league_key in due:
+                games = self.store.league_games(league_key)
+                if league_key not in answered:
+                    self.poller.schedule_retry(league_key, games, now)
+                    continue
+                previous = self.poller.intervals.get(league_key)
+                interval = self.poller.schedule(league_key, games, now)
+                if interval != previous:
+                    print(f"Polling {league_key} every {interval}s")
+    
+    def refresh_priority(self):
+        """Quick refresh of the priority games only"""
+        print("Quick check of priority games...")
+        start = time.perf_counter()
+        event_ids = self.priority_event_ids()
+        sport_configs = [c for c in SPORTS_CONFIG if c['league'] in event_ids]
+        games, league_keys = self.fetch_games(sport_configs, event_ids)
+        if self.store.apply(games, league_keys, event_ids):
+            self.publish_snapshot()
+        self.metrics.refresh_seconds.observe(time.perf_counter() - start, kind='priority')
+    
+    def refresh_loop(self):
+        """Background refresh scheduler
+        
+        Each league is polled on its own adaptive interval (see PollScheduler)
+        and priority games in progress are checked every
+        PRIORITY_UPDATE_INTERVAL in between. Intervals are measured on the
+        wall clock, independent of how long each game stays on screen.
+        """
+        next_priority = time.monotonic() + PRIORITY_UPDATE_INTERVAL
+        next_metrics_log = time.monotonic() + METRICS_LOG_INTERVAL if METRICS_LOG_INTERVAL else float('inf')
+        
+        while not self.stop_event.is_set():
+            try:
+                self.refresh_due()
+            except Exception as e:
+                print(f"Error refreshing scores: {e}")
+            
+            # Deadlines move on whether or not their work succeeds
+            now = time.monotonic()
+            if now >= next_priority:
+                next_priority = next_deadline(next_priority, PRIORITY_UPDATE_INTERVAL, now)
+                try:
+                    if self.priority_event_ids():
+                        self.refresh_priority()
+                except Exception as e:
+                    print(f"Error checking priority games: {e}")
+            if now >= next_metrics_log:
+                next_metrics_log = next_deadline(next_metrics_log, METRICS_LOG_INTERVAL, now)
+                try:
+                    self.log_metrics()
+                except Exception as e:
+                    print(f"Error logging metrics: {e}")
+            
+            next_wakeup = min(self.poller.next_wakeup(), next_priority, next_metrics_log)
+            self.stop_event.wait(max(0, next_wakeup - time.monotonic()))
+    
+    def collect_metrics(self):
+        """Update the gauges that are only worth computing when metrics are read"""
+        now = time.time()
+        for league_key, fetched_at in list(self.fetched_at.items()):
+            self.metrics.score_age.set(round(now - fetched_at, 1), league=league_key)
+        for league_key, interval in list(self.poller.intervals.items()):
+            self.metrics.poll_interval.set(interval, league=league_key)
+        counts = dict.fromkeys(self.fetched_at, 0)
+        for game in self.snapshot.games:
+            counts[game.league_key] = counts.get(game.league_key, 0) + 1
+        for league_key, count in counts.items():
+            self.metrics.games.set(count, league=league_key)
+        self.metrics.frame_cache.set(self.frame_cache.hits, result='hit')
+        self.metrics.frame_cache.set(self.frame_cache.misses, result='miss')
+        self.metrics.cpu_seconds.set(round(time.process_time(), 2))
+    
+    def log_metrics(self):
+        """One structured line in the log with every metric"""
+        print("metrics " + json.dumps(self.metrics.summary(), sort_keys=True))
+    
+    def start_metrics_server(self):
+        """Serve the metrics endpoint, if METRICS_PORT is set"""
+        if not METRICS_PORT:
+            return
+        try:
+            serve(self.metrics, METRICS_HOST, METRICS_PORT)
+            print(f"Metrics at http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+        except OSError as e:
+            print(f"Error starting metrics server: {e}")
+    
+    def start_refresh(self):
+        """Start the background refresh thread"""
+        self.refresh_thread = threading.Thread(target=self.refresh_loop, name='refresh',
+                                               daemon=True)
+        self.refresh_thread.start()
+    
+    def stop_refresh(self):
+        """Stop the background refresh thread"""
+        self.stop_event.set()
+        if self.refresh_thread:
+            self.refresh_thread.join(timeout=FETCH_DEADLINE)
+        self.executor.shutdown(wait=False)
+        self.session.close()
+    
+    def rotate_loop(self):
+        """Show a frame of games at a time
+        
+        A score change cuts the wait for the next frame short, so the game
+        that scored is on screen as soon as its snapshot is published rather
+        than whenever the rotation gets round to it.
+        """
+        game_index = 0
+        shown_snapshot = None
+        while True:
+            self.snapshot_ready.clear()
+            # Taken before reading the snapshot, which then has the new score
+            highlight = self.take_highlight() if self.score_changed.is_set() else None
+            snapshot = self.snapshot
+            games = snapshot.games
+            if snapshot is not shown_snapshot:
+                # Drop the frames of pages that no longer exist
+                self.frame_cache.retain({tuple(game_key(game) for game in page)
+                                         for page in self.pages(games)})
+                shown_snapshot = snapshot
+                # Stay on page boundaries, or every page would miss the cache
+                game_index -= game_index % self.layout.games_per_frame
+            
+            if highlight:
+                keys = [game_key(game) for game in games]
+                if highlight.key in keys:
+                    # Jump to the page with the game that scored
+                    position = keys.index(highlight.key)
+                    game_index = position - position % self.layout.games_per_frame
+                else:
+                    highlight = None
+            
+            if games:
+                if game_index >= len(games):
                     game_index = 0
-                    self.check_priority_score_changes()
-                
-                elif self.priority_games and priority_check_counter % PRIORITY_UPDATE_INTERVAL == 0:
-                    print("Quick check of priority games...")
-                    new_priority_games, _ = self.get_all_games()
-                    
-                    if new_priority_games:
-                        for i, game in enumerate(self.current_games):
-                            if game['is_priority']:
-                                for new_game in new_priority_games:
-                                    if new_game['id'] == game['id']:
-                                        self.current_games[i] = new_game
-                                        break
-                        
-                        self.priority_games = new_priority_games
-                        
-                        if self.check_priority_score_changes():
-                            game_index = 0
-                            print("Priority game score changed! Updating display...")
-                
-                if self.current_games:
-                    game = self.current_games[game_index]
-                    self.draw_game(game)
-                    
-                    display_time = PRIORITY_GAME_DISPLAY_TIME if game['is_priority'] else NON_PRIORITY_GAME_DISPLAY_TIME
-                    time.sleep(display_time)
-                    
-                    game_index = (game_index + 1) % len(self.current_games)
+                page = games[game_index:game_index + self.layout.games_per_frame]
+                if highlight:
+                    self.show_score_change(page, highlight)
                 else:
-                    self.draw_no_games()
-                    time.sleep(5)
+                    self.draw_games(page)
                 
-                update_counter += 1
-                priority_check_counter += 1
+                if any(game.is_priority for game in page):
+                    display_time = PRIORITY_GAME_DISPLAY_TIME
+                else:
+                    display_time = NON_PRIORITY_GAME_DISPLAY_TIME
+                if self.score_changed.wait(display_time):
+                    continue
                 
+                game_index = (game_index + len(page)) % len(games)
+            else:
+                self.draw_no_games()
+                # Wake early as soon as the first games arrive
+                self.snapshot_ready.wait(5)
+    
+    def ticker_loop(self):
+        """Scroll every game past at a steady frame rate
+        
+        The strip is only rendered when a snapshot changes the games; each
+        frame just crops a window out of it, so text is never drawn per frame.
+        """
+        frame_time = 1.0 / TICKER_FPS
+        shown_snapshot = None
+        last_frame = next_frame = next_age_check = time.monotonic()
+        while True:
+            self.snapshot_ready.clear()
+            highlight = self.take_highlight() if self.score_changed.is_set() else None
+            snapshot = self.snapshot
+            if not snapshot.games:
+                shown_snapshot = None
+                self.draw_no_games()
+                self.snapshot_ready.wait(5)
+                last_frame = next_frame = time.monotonic()
+                continue
+            now = time.monotonic()
+            if snapshot is not shown_snapshot or (snapshot.stale and now >= next_age_check):
+                # Stale ages tick on without a new snapshot, check them every second
+                self.update_ticker(snapshot)
+                shown_snapshot = snapshot
+                next_age_check = now + 1
+            
+            self.scroll_pos += (now - last_frame) * TICKER_SPEED
+            if self.ticker_strip.scrolls:
+                self.scroll_pos %= self.ticker_strip.content_width
+            last_frame = now
+            game = self.show_ticker_score_change(highlight, now) if highlight else None
+            self.draw_ticker_frame(now)
+            if game:
+                self.record_highlight(game, highlight)
+            
+            now = time.monotonic()
+            if now >= next_frame + frame_time:
+                self.metrics.late_frames.inc()
+            next_frame = next_deadline(next_frame, frame_time, now)
+            time.sleep(max(0, next_frame - time.monotonic()))
+    
+    def run(self):
+        """Main display loop with priority team monitoring
+        
+        Scores are refreshed on a background thread; the display loop only
+        renders whatever snapshot is current and never waits on the network.
+        """
+        print("Starting Sports Score Display v2.0...")
+        print(f"Priority Teams configured: {len(PRIORITY_TEAMS)} leagues")
+        self.load_saved_games()
+        self.start_metrics_server()
+        self.start_refresh()
+        
+        try:
+            if self.ticker:
+                self.ticker_loop()
+            else:
+                self.rotate_loop()
         except KeyboardInterrupt:
             print("\nShutting down...")
+            self.stop_refresh()
             self.canvas.Clear()
-            self.canvas = self.matrix.SwapOnVSync(self.canvas)
+            self.present(self.canvas)
 
 if __name__ == "__main__":
     display = SportsScoreDisplay()
@@ -0,0 +1,181 @@
+"""
+Synthetic ESPN scoreboards for the Sports Score Display
+Slates shaped and sized like ESPN's, for benchmarks and replays
+"""
+
+import random
+import time
+
+# (ESPN id, location, nickname, abbreviation)
+SCHOOLS = [
+    ('8', 'Arkansas', 'Razorbacks', 'ARK'), ('2032', 'Arkansas State', 'Red Wolves', 'ARST'),
+    ('333', 'Alabama', 'Crimson Tide', 'ALA'), ('61', 'Georgia', 'Bulldogs', 'UGA'),
+    ('99', 'LSU', 'Tigers', 'LSU'), ('2633', 'Tennessee', 'Volunteers', 'TENN'),
+    ('57', 'Florida', 'Gators', 'FLA'), ('251', 'Texas', 'Longhorns', 'TEX'),
+    ('201', 'Oklahoma', 'Sooners', 'OU'), ('145', 'Ole Miss', 'Rebels', 'MISS'),
+    ('344', 'Mississippi State', 'Bulldogs', 'MSST'), ('245', 'Texas A&M', 'Aggies', 'TA&M'),
+    ('2', 'Auburn', 'Tigers', 'AUB'), ('142', 'Missouri', 'Tigers', 'MIZ'),
+    ('2579', 'South Carolina', 'Gamecocks', 'SC'), ('96', 'Kentucky', 'Wildcats', 'UK'),
+    ('238', 'Vanderbilt', 'Commodores', 'VAN'), ('194', 'Ohio State', 'Buckeyes', 'OSU'),
+    ('130', 'Michigan', 'Wolverines', 'MICH'), ('213', 'Penn State', 'Nittany Lions', 'PSU'),
+    ('275', 'Wisconsin', 'Badgers', 'WIS'), ('158', 'Nebraska', 'Cornhuskers', 'NEB'),
+    ('2294', 'Iowa', 'Hawkeyes', 'IOWA'), ('127', 'Michigan State', 'Spartans', 'MSU'),
+    ('84', 'Indiana', 'Hoosiers', 'IU'), ('2026', 'Appalachian State', 'Mountaineers', 'APP'),
+]
+STATES = ['pre', 'in', 'in', 'in', 'post']
+
+
+def synthetic_team(rng, index):
+    """A competitor's team block, as bulky as ESPN's"""
+    team_id, location, nickname, abbreviation = rng.choice(SCHOOLS)
+    return {
+        'id': team_id,
+        'uid': f's:20~l:23~t:{team_id}',
+        'location': location,
+        'name': nickname,
+        'abbreviation': abbreviation,
+        'displayName': f'{location} {nickname}',
+        'shortDisplayName': location,
+        'color': '9d2235',
+        'alternateColor': 'ffffff',
+        'isActive': True,
+        'venue': {'id': str(4000 + index)},
+        'links': [{'rel': ['clubhouse', 'desktop', 'team'],
+                   'href': f'https://www.espn.com/college-football/team/_/id/{team_id}',
+                   'text': text, 'isExternal': False, 'isPremium': False}
+                  for text in ('Clubhouse', 'Schedule', 'Roster', 'Statistics', 'Tickets')],
+        'logo': f'https://a.espncdn.com/i/teamlogos/ncaa/500/{team_id}.png',
+        'conferenceId': str(rng.randint(1, 40)),
+    }
+
+
+def synthetic_competitor(rng, index, home_away, state):
+    """A competitor with linescores, stats, records and leaders"""
+    return {
+        'id': str(index),
+        'uid': f's:20~l:23~t:{index}',
+        'type': 'team',
+        'order': 0 if home_away == 'home' else 1,
+        'homeAway': home_away,
+        'team': synthetic_team(rng, index),
+        'score': '0' if state == 'pre' else str(rng.randint(0, 56)),
+        'linescores': [{'value': float(rng.randint(0, 14))} for _ in range(4)],
+        'statistics': [{'name': name, 'abbreviation': name[:3].upper(),
+                        'displayValue': str(rng.randint(0, 500))}
+                       for name in ('passingYards', 'rushingYards', 'totalYards',
+                                    'turnovers', 'firstDowns', 'penalties')],
+        'curatedRank': {'current': rng.randint(1, 99)},
+        'records': [{'name': name, 'abbreviation': 'Any', 'type': name.lower(),
+                     'summary': f'{rng.randint(0, 12)}-{rng.randint(0, 12)}'}
+                    for name in ('overall', 'Home', 'Road', 'vs. Conf.')],
+        'leaders': [{'name': kind, 'displayName': f'{kind} Leader', 'leaders': [{
+            'displayValue': f'{rng.randint(1, 30)}-{rng.randint(1, 40)}, {rng.randint(0, 400)} YDS',
+            'value': float(rng.randint(0, 400)),
+            'athlete': {'id': str(rng.randint(1, 10 ** 7)), 'fullName': 'Some Player',
+                        'displayName': 'Some Player', 'shortName': 'S. Player',
+                        'headshot': 'https://a.espncdn.com/i/headshots/college-football/players/full/1.png',
+                        'jersey': str(rng.randint(1, 99)), 'position': {'abbreviation': 'QB'}},
+        }]} for kind in ('passingYards', 'rushingYards', 'receivingYards')],
+    }
+
+
+def synthetic_event(rng, index, state=None):
+    """One scoreboard event shaped like ESPN's"""
+    state = state or rng.choice(STATES)
+    detail = {'pre': '10/18 - 2:30 PM EDT', 'in': f'{rng.randint(0, 14)}:{rng.randint(10, 59)} - 3rd',
+              'post': 'Final'}[state]
+    status = {'clock': 0.0, 'displayClock': '0:00', 'period': 3,
+              'type': {'id': '2', 'name': 'STATUS_IN_PROGRESS', 'state': state, 'completed': state == 'post',
+                       'description': 'In Progress', 'detail': detail, 'shortDetail': detail}}
+    event_id = str(401_000_000 + index)
+    competition = {
+        'id': event_id, 'uid': f's:20~l:23~e:{event_id}~c:{event_id}', 'date': '2026-10-17T18:30Z',
+        'attendance': rng.randint(0, 100000), 'type': {'id': '1', 'abbreviation': 'STD'},
+        'timeValid': True, 'neutralSite': False, 'conferenceCompetition': True, 'recent': False,
+        'venue': {'id': str(3000 + index), 'fullName': 'Some Stadium',
+                  'address': {'city': 'Somewhere', 'state': 'AR'}, 'indoor': False},
+        'competitors': [synthetic_competitor(rng, index * 2, 'home', state),
+                        synthetic_competitor(rng, index * 2 + 1, 'away', state)],
+        'notes': [], 'status': status,
+        'broadcasts': [{'market': 'national', 'names': ['ESPN', 'ESPN App']}],
+        'geoBroadcasts': [{'type': {'id': '1', 'shortName': 'TV'}, 'market': {'id': '1', 'type': 'National'},
+                           'media': {'shortName': name}, 'lang': 'en', 'region': 'us'}
+                          for name in ('ESPN', 'ESPN2', 'ESPNU')],
+        'odds': [{'provider': {'id': '58', 'name': 'ESPN BET', 'priority': 1},
+                  'details': 'ARK -3.5', 'overUnder': 55.5, 'spread': -3.5}],
+        'headlines': [{'type': 'Recap', 'description': 'Some team beat some other team. ' * 4,
+                       'shortLinkText': 'Recap'}],
+    }
+    return {
+        'id': event_id, 'uid': f's:20~l:23~e:{event_id}', 'date': '2026-10-17T18:30Z',
+        'name': 'Visitors at Hosts', 'shortName': 'VIS @ HOS',
+        'season': {'year': 2026, 'type': 2, 'slug': 'regular-season'}, 'week': {'number': 8},
+        'competitions': [competition],
+        'links': [{'language': 'en-US', 'rel': ['summary', 'desktop', 'event'],
+                   'href': f'https://www.espn.com/college-football/game/_/gameId/{event_id}',
+                   'text': text, 'shortText': text, 'isExternal': False, 'isPremium': False}
+                  for text in ('Gamecast', 'Box Score', 'Play-by-Play')],
+        'status': status,
+    }
+
+
+def synthetic_scoreboard(events=300, seed=0, state=None):
+    """A full ESPN-style scoreboard with the given number of events
+
+    Games are a random mix of upcoming, in progress and final unless state
+    is given.
+    """
+    rng = random.Random(seed)
+    calendar = [{'label': f'Week {week}', 'value': str(week), 'startDate': '2026-08-23T07:00Z',
+                 'endDate': '2026-08-30T06:59Z'} for week in range(1, 17)]
+    return {
+        'leagues': [{'id': '23', 'uid': 's:20~l:23', 'name': 'NCAA - Football',
+                     'abbreviation': 'NCAAF', 'slug': 'college-football',
+                     'season': {'year': 2026, 'type': {'id': '2', 'type': 2, 'name': 'Regular Season'}},
+                     'calendar': [{'label': 'Regular Season', 'entries': calendar}]}],
+        'season': {'type': 2, 'year': 2026},
+        'week': {'number': 8},
+        'events': [synthetic_event(rng, index, state) for index in range(events)],
+    }
+
+
+class SyntheticSlate:
+    """A slate of games in progress that score as time goes on
+
+    Scores arrive at random, scoring_rate per game per minute of game time
+    on average, and speed runs game time faster than the wall clock. Every
+    score is kept in changes, keyed by (league_key, event id), as
+    (wall time, away score, home score), so a harness can tell when each
+    score could first have been seen. A scoring_rate of 0 never scores.
+    """
+
+    def __init__(self, league_key='college-football', events=150, seed=0, scoring_rate=0.2,
+                 speed=1.0, clock=time.time):
+        self.league_key = league_key
+        self.rng = random.Random(seed)
+        self.scoreboard = synthetic_scoreboard(events, seed, state='in')
+        self.rate = scoring_rate / 60 * events * speed
+        if self.rate > 0:
+            self.next_score = clock() + self.rng.expovariate(self.rate)
+        else:
+            self.next_score = float('inf')
+        self.version = 0
+        self.changes = {}
+
+    def advance(self, now):
+        """Score every point due by now, returns True if anything changed"""
+        changed = False
+        events = self.scoreboard['events']
+        while self.next_score <= now:
+            event = self.rng.choice(events)
+            # The parser reads the first competitor as the away team
+            away, home = event['competitions'][0]['competitors'][:2]
+            scorer = self.rng.choice((away, home))
+            scorer['score'] = str(int(scorer['score']) + self.rng.choice((3, 7)))
+            self.changes.setdefault((self.league_key, event['id']), []).append(
+                (self.next_score, int(away['score']), int(home['score'])))
+            self.next_score += self.rng.expovariate(self.rate)
+            changed = True
+        if changed:
+            self.version += 1
+        return changed
@@ -0,0 +1,69 @@
+"""
+Team index for the Sports Score Display
+Team colors and descriptions keyed by (league, abbreviation), loaded from teams/*.json
+"""
+
+import json
+import os
+from collections import namedtuple
+
+TEAMS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'teams')
+
+TeamInfo = namedtuple('TeamInfo', ['abbreviation', 'description', 'color'])
+
+
+class TeamIndex:
+    """Per-league team lookup
+
+    Abbreviations are only unique within a league (HOU is the Astros, the
+    Texans and the Rockets), so every lookup is scoped to a league. A data
+    file is read the first time one of its leagues is looked up, so startup
+    cost and memory do not grow with the number of teams on file.
+    """
+
+    def __init__(self, color_factory, data_files, directory=TEAMS_DIR):
+        # data_files maps a league key to the name of its file in directory,
+        # several leagues (all the college sports) can share one file
+        self.color_factory = color_factory
+        self.data_files = data_files
+        self.directory = directory
+        self.files = {}
+        self.leagues = {}
+
+    def load_file(self, name):
+        """Read one data file into {abbreviation: TeamInfo}"""
+        teams = {}
+        path = os.path.join(self.directory, name + '.json')
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return teams
+        except Exception as e:
+            print(f"Error loading team data {path}: {e}")
+            return teams
+
+        for abbreviation, team in data.items():
+            teams[abbreviation] = TeamInfo(abbreviation, team.get('description', ''),
+                                           self.color_factory(*team['color']))
+        return teams
+
+    def league(self, league_key):
+        """All teams for a league, loading its data file on first use"""
+        teams = self.leagues.get(league_key)
+        if teams is None:
+            name = self.data_files.get(league_key, league_key)
+            teams = self.files.get(name)
+            if teams is None:
+                teams = self.files[name] = self.load_file(name)
+            self.leagues[league_key] = teams
+        return teams
+
+    def get(self, league_key, abbreviation):
+        """TeamInfo for a team, or None if it is not on file"""
+        return self.league(league_key).get(abbreviation)
+
+    def color(self, league_key, abbreviation, default=None):
+        """Team color, or default if the team is not on file"""
+        team = self.league(league_key).get(abbreviation)
+        return team.color if team else default
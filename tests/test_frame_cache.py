@@ -0,0 +1,68 @@
+import unittest
+
+import headless
+from frame_cache import FrameCache
+
+
+class FrameCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = FrameCache(lambda: headless.FrameCanvas(128, 32), size=3)
+
+    def fill(self, *keys, busy=None):
+        return [self.cache.acquire(key, key, busy=busy) for key in keys]
+
+    def test_hits_and_misses(self):
+        self.assertIsNone(self.cache.get('a'))
+        frame, = self.fill('a')
+        self.assertIs(self.cache.get('a'), frame)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_creates_at_most_size_canvases(self):
+        frames = self.fill('a', 'b', 'c', 'd', 'e')
+        self.assertEqual(self.cache.created, 3)
+        self.assertEqual(len({id(frame.canvas) for frame in frames}), 3)
+
+    def test_evicts_least_recently_used(self):
+        self.fill('a', 'b', 'c')
+        self.cache.get('a')
+        self.fill('d')
+        self.assertEqual(list(self.cache.entries), ['c', 'a', 'd'])
+
+    def test_busy_canvas_is_never_reused(self):
+        a, b, c = self.fill('a', 'b', 'c')
+        # 'a' is on screen, so the next oldest frame gives up its canvas
+        d, = self.fill('d', busy=a.canvas)
+        self.assertIs(d.canvas, b.canvas)
+        self.assertIn('a', self.cache.entries)
+
+    def test_busy_free_canvas_is_skipped(self):
+        a, b, c = self.fill('a', 'b', 'c')
+        self.cache.retain({'b', 'c'})
+        d, = self.fill('d', busy=a.canvas)
+        self.assertIs(d.canvas, b.canvas)
+        self.assertEqual(self.cache.free, [a.canvas])
+
+    def test_acquire_gives_a_blank_canvas(self):
+        a, = self.fill('a')
+        a.canvas.SetPixel(0, 0, 255, 255, 255)
+        self.cache.evict('a')
+        b, = self.fill('b')
+        self.assertIs(b.canvas, a.canvas)
+        self.assertEqual(b.canvas.GetPixel(0, 0), (0, 0, 0))
+
+    def test_reacquiring_a_key_replaces_its_frame(self):
+        self.fill('a')
+        frame = self.cache.acquire('a', 'new')
+        self.assertEqual(len(self.cache.entries), 1)
+        self.assertEqual(self.cache.get('a').fields, 'new')
+        self.assertIs(self.cache.get('a'), frame)
+
+    def test_retain_recycles_dropped_frames(self):
+        a, b, c = self.fill('a', 'b', 'c')
+        self.cache.retain({'b'})
+        self.assertEqual(list(self.cache.entries), ['b'])
+        self.assertEqual(self.cache.free, [a.canvas, c.canvas])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from game_store import (ADDED, REMOVED, SCORE_CHANGED, STATUS_CHANGED, Game, GameStore,
+                        game_key, parse_score)
+
+
+def game(game_id, league_key='mlb', away_score=0, home_score=0, status='Top 1st', state='in',
+         is_priority=False):
+    return Game(game_id, league_key.upper(), league_key, 'HOU', 'NYY', away_score, home_score,
+                status, state, is_priority)
+
+
+class GameStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = GameStore()
+        self.heard = []
+        self.store.subscribe(self.heard.append)
+
+    def kinds(self, events):
+        return [(event.kind, event.game.id) for event in events]
+
+    def test_new_games_are_added(self):
+        events = self.store.apply([game('1'), game('2')], {'mlb'})
+        self.assertEqual(self.kinds(events), [(ADDED, '1'), (ADDED, '2')])
+        self.assertEqual(self.heard, [events])
+
+    def test_unchanged_fetch_reports_nothing(self):
+        self.store.apply([game('1')], {'mlb'})
+        self.heard.clear()
+        self.assertEqual(self.store.apply([game('1')], {'mlb'}), [])
+        self.assertEqual(self.heard, [])
+
+    def test_score_and_status_changes(self):
+        self.store.apply([game('1')], {'mlb'})
+        events = self.store.apply([game('1', away_score=2, status='Top 2nd')], {'mlb'})
+        self.assertEqual(self.kinds(events), [(SCORE_CHANGED, '1'), (STATUS_CHANGED, '1')])
+        self.assertEqual(events[0].previous.away_score, 0)
+        self.assertEqual(events[0].game.away_score, 2)
+
+    def test_missing_games_are_evicted(self):
+        self.store.apply([game('1'), game('2')], {'mlb'})
+        events = self.store.apply([game('2')], {'mlb'})
+        self.assertEqual(self.kinds(events), [(REMOVED, '1')])
+        self.assertEqual(list(self.store.games), [('mlb', '2')])
+
+    def test_leagues_not_fetched_are_left_alone(self):
+        self.store.apply([game('1'), game('1', 'nfl')], {'mlb', 'nfl'})
+        events = self.store.apply([], {'nfl'})
+        self.assertEqual(self.kinds(events), [(REMOVED, '1')])
+        self.assertIn(('mlb', '1'), self.store.games)
+
+    def test_only_fetched_events_can_be_evicted(self):
+        self.store.apply([game('1'), game('2'), game('3')], {'mlb'})
+        events = self.store.apply([game('1', home_score=1)], {'mlb'}, {'mlb': {'1', '2'}})
+        self.assertEqual(self.kinds(events), [(SCORE_CHANGED, '1'), (REMOVED, '2')])
+        self.assertIn(('mlb', '3'), self.store.games)
+
+    def test_ids_are_only_unique_per_league(self):
+        self.store.apply([game('1'), game('1', 'nfl')], {'mlb', 'nfl'})
+        self.assertEqual(len(self.store.games), 2)
+        self.assertEqual(game_key(game('1', 'nfl')), ('nfl', '1'))
+
+    def test_priority_games_come_first(self):
+        self.store.apply([game('1'), game('2', is_priority=True)], {'mlb'})
+        self.assertEqual([g.id for g in self.store.ordered_games()], ['2', '1'])
+        self.assertEqual([g.id for g in self.store.priority_games()], ['2'])
+
+    def test_load_reports_no_events(self):
+        self.store.load([game('1')])
+        self.assertEqual(self.heard, [])
+        self.assertEqual(self.store.apply([game('1')], {'mlb'}), [])
+
+
+class ParseScoreTest(unittest.TestCase):
+    def test_scores(self):
+        self.assertEqual(parse_score('7'), 7)
+        self.assertEqual(parse_score(''), 0)
+        self.assertEqual(parse_score(None), 0)
+        self.assertEqual(parse_score('--'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+
+import headless
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Two glyphs: 'A' is a 3x4 box sitting one row above the baseline, 'B' a
+# 2x2 block hanging one row below it
+BDF = '''STARTFONT 2.1
+FONTBOUNDINGBOX 4 6 0 -1
+CHARS 2
+STARTCHAR A
+ENCODING 65
+DWIDTH 4 0
+BBX 3 4 0 1
+BITMAP
+E0
+A0
+A0
+E0
+ENDCHAR
+STARTCHAR B
+ENCODING 66
+DWIDTH 3 0
+BBX 2 2 0 -1
+BITMAP
+C0
+C0
+ENDCHAR
+ENDFONT
+'''
+
+
+def lit(canvas):
+    """Every pixel that isn't black, as (x, y)"""
+    return {(x, y) for y in range(canvas.height) for x in range(canvas.width)
+            if canvas.GetPixel(x, y) != (0, 0, 0)}
+
+
+def load_font(test, text):
+    """A headless Font loaded from text, removed when the test ends"""
+    with tempfile.NamedTemporaryFile('w', suffix='.bdf', delete=False) as f:
+        f.write(text)
+    test.addCleanup(os.remove, f.name)
+    font = headless.Font()
+    font.LoadFont(f.name)
+    return font
+
+
+class FontTest(unittest.TestCase):
+    def test_bdf(self):
+        font = load_font(self, BDF)
+        self.assertEqual((font.height, font.baseline), (6, 5))
+        self.assertEqual(font.CharacterWidth(ord('A')), 4)
+        self.assertEqual(font.glyph(ord('A')).rows, [0b111, 0b101, 0b101, 0b111])
+
+    def test_falls_back_to_block_font(self):
+        for font in (headless.Font(), load_font(self, 'not a font\n')):
+            self.assertEqual(font.CharacterWidth(ord('A')), 6)
+        font = headless.Font()
+        font.LoadFont('/no/such/font.bdf')
+        self.assertEqual((font.height, font.baseline), (8, 7))
+
+
+class DrawTest(unittest.TestCase):
+    def setUp(self):
+        self.canvas = headless.FrameCanvas(16, 8)
+        self.white = headless.Color(255, 255, 255)
+
+    def test_draw_text_places_glyphs_like_rgbmatrix(self):
+        font = load_font(self, BDF)
+        width = headless.DrawText(self.canvas, font, 1, 5, self.white, 'AB')
+        self.assertEqual(width, 7)
+        box = {(x, y) for x in range(1, 4) for y in range(0, 4)} - {(2, 1), (2, 2)}
+        # Top at baseline - height - y offset
+        block = {(x, y) for x in (5, 6) for y in (4, 5)}
+        self.assertEqual(lit(self.canvas), box | block)
+
+    def test_draw_text_clips(self):
+        headless.DrawText(self.canvas, headless.Font(), 14, 3, self.white, 'AA')
+        self.assertEqual({x for x, y in lit(self.canvas)}, {14, 15})
+
+    def test_draw_line(self):
+        headless.DrawLine(self.canvas, 0, 0, 3, 3, self.white)
+        self.assertEqual(lit(self.canvas), {(0, 0), (1, 1), (2, 2), (3, 3)})
+        self.canvas.Clear()
+        headless.DrawLine(self.canvas, 5, 2, 2, 2, self.white)
+        self.assertEqual(lit(self.canvas), {(x, 2) for x in range(2, 6)})
+
+
+class FrameCanvasTest(unittest.TestCase):
+    def test_pixels(self):
+        canvas = headless.FrameCanvas(4, 2)
+        canvas.SetPixel(3, 1, 1, 2, 3)
+        canvas.SetPixel(4, 0, 9, 9, 9)
+        canvas.SetPixel(-1, 0, 9, 9, 9)
+        self.assertEqual(canvas.GetPixel(3, 1), (1, 2, 3))
+        self.assertEqual(lit(canvas), {(3, 1)})
+        canvas.Fill(5, 5, 5)
+        self.assertEqual(len(lit(canvas)), 8)
+        canvas.Clear()
+        self.assertEqual(lit(canvas), set())
+
+    def test_save(self):
+        canvas = headless.FrameCanvas(2, 1)
+        canvas.SetPixel(1, 0, 255, 0, 0)
+        with tempfile.NamedTemporaryFile(suffix='.ppm', delete=False) as f:
+            path = f.name
+        self.addCleanup(os.remove, path)
+        canvas.save(path)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'P6 2 1 255\n\x00\x00\x00\xff\x00\x00')
+
+    @unittest.skipIf(Image is None, 'needs PIL')
+    def test_set_image_clips(self):
+        canvas = headless.FrameCanvas(4, 4)
+        canvas.SetImage(Image.new('RGB', (3, 3), (0, 255, 0)), 2, -1)
+        self.assertEqual(lit(canvas), {(x, y) for x in (2, 3) for y in (0, 1)})
+        canvas.SetImage(Image.new('RGB', (2, 2), (0, 255, 0)), 5, 0)
+        self.assertEqual(len(lit(canvas)), 4)
+
+
+class RGBMatrixTest(unittest.TestCase):
+    def test_size_and_swaps(self):
+        options = headless.RGBMatrixOptions()
+        options.rows, options.cols, options.chain_length, options.parallel = 32, 64, 2, 2
+        matrix = headless.RGBMatrix(options=options)
+        self.assertEqual((matrix.width, matrix.height), (128, 64))
+        canvas = matrix.CreateFrameCanvas()
+        front = matrix.front
+        self.assertIs(matrix.SwapOnVSync(canvas), front)
+        self.assertIs(matrix.front, canvas)
+        self.assertEqual(matrix.swaps, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
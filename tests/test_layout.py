@@ -0,0 +1,64 @@
+import unittest
+
+import headless
+from layout import GAME_HEIGHT, Layout, Tile, measure_font
+
+# Unloaded headless fonts draw every character 6 pixels wide, so a tile
+# needs 2 + 4 * 6 + 2 for the team, 3 * 6 for the score and 2 padding
+MIN_TILE_WIDTH = 48
+
+
+def layout(width=128, height=32, **kwargs):
+    return Layout(width, height, headless.Font(), headless.Font(), **kwargs)
+
+
+class LayoutTest(unittest.TestCase):
+    def test_measure_font(self):
+        widths = measure_font(headless.Font())
+        self.assertEqual(len(widths), 95)
+        self.assertEqual(widths['A'], 6)
+
+    def test_line_rows(self):
+        # The fallback font is 8 rows tall with its baseline 7 rows down
+        tiles = layout()
+        self.assertEqual(tiles.header_rows, (1, 8))
+        self.assertEqual(tiles.score_rows, (10, 25))
+        # Clipped to the bottom of the tile
+        self.assertEqual(tiles.status_rows, (25, 31))
+        # The home score's bottom row is the status line's top row
+        self.assertEqual(tiles.score_block_rows, (10, 24))
+
+    def test_score_column(self):
+        tiles = layout()
+        self.assertEqual(tiles.score_x, 28)
+        self.assertEqual(tiles.score_width, 18)
+
+    def test_leftover_width_is_shared(self):
+        self.assertEqual(layout().tiles, (Tile(0, 0, 64), Tile(64, 0, 64)))
+
+    def test_narrow_matrix_still_gets_a_tile(self):
+        self.assertEqual(layout(width=32).tiles, (Tile(0, 0, 32),))
+
+    def test_chained_panels(self):
+        tiles = layout(width=256, height=64).tiles
+        self.assertEqual(len(tiles), 10)
+        self.assertEqual(tiles[5], Tile(0, GAME_HEIGHT, 51))
+
+    def test_tile_width(self):
+        self.assertEqual(layout(tile_width=100).games_per_frame, 1)
+        # Never narrower than a game needs
+        self.assertEqual(layout(tile_width=10).games_per_frame, 128 // MIN_TILE_WIDTH)
+
+    def test_max_games(self):
+        self.assertEqual(layout(max_games=1).tiles, (Tile(0, 0, 128),))
+        self.assertEqual(layout(width=256, height=64, max_games=4).games_per_frame, 4)
+
+    def test_text_width_and_fit(self):
+        tiles = layout()
+        self.assertEqual(tiles.text_width(tiles.small, 'Top 7th'), 42)
+        self.assertEqual(tiles.fit(tiles.small, 'Top 7th', 20), 'Top')
+        self.assertEqual(tiles.fit(tiles.small, 'Top', 100), 'Top')
+
+
+if __name__ == '__main__':
+    unittest.main()
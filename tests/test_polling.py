@@ -0,0 +1,61 @@
+import unittest
+
+from game_store import Game
+from polling import PollScheduler
+
+
+def game(status='Top 3rd', state='in', away_score=0, home_score=0, league_key='mlb'):
+    return Game('1', league_key.upper(), league_key, 'HOU', 'NYY', away_score, home_score,
+                status, state, False)
+
+
+class PollSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.poller = PollScheduler(
+            {'mlb': 'baseball', 'nfl': 'football'}, live_interval=60, pre_game_interval=300,
+            break_interval=120, close_interval=15, idle_interval=1800,
+            break_pattern=r'halftime|delay', close_rules={'baseball': (2, r'\b9th\b')})
+
+    def test_game_intervals(self):
+        self.assertEqual(self.poller.game_interval(game(state='pre')), 300)
+        self.assertEqual(self.poller.game_interval(game(status='Rain Delay')), 120)
+        self.assertEqual(self.poller.game_interval(game()), 60)
+        self.assertEqual(self.poller.game_interval(game(status='Bot 9th', away_score=2)), 15)
+        # Not close enough
+        self.assertEqual(self.poller.game_interval(game(status='Bot 9th', away_score=5)), 60)
+        # No close game rule for the sport
+        self.assertEqual(self.poller.game_interval(game(status='4th', league_key='nfl')), 60)
+
+    def test_is_active(self):
+        self.assertTrue(self.poller.is_active(game()))
+        self.assertTrue(self.poller.is_active(game(status='Bot 9th')))
+        self.assertFalse(self.poller.is_active(game(state='pre')))
+        self.assertFalse(self.poller.is_active(game(status='Halftime')))
+
+    def test_league_polls_as_often_as_its_most_urgent_game(self):
+        games = [game(state='pre'), game(status='Halftime'), game()]
+        self.assertEqual(self.poller.league_interval(games), 60)
+        self.assertEqual(self.poller.league_interval([]), 1800)
+
+    def test_everything_is_due_at_first(self):
+        self.assertEqual(sorted(self.poller.due(0)), ['mlb', 'nfl'])
+        self.assertEqual(self.poller.next_wakeup(), 0)
+
+    def test_schedule(self):
+        self.assertEqual(self.poller.schedule('mlb', [game()], 100), 60)
+        self.assertEqual(self.poller.schedule('nfl', [], 100), 1800)
+        self.assertEqual(self.poller.due(159), [])
+        self.assertEqual(self.poller.due(160), ['mlb'])
+        self.assertEqual(self.poller.next_wakeup(), 160)
+        self.assertEqual(self.poller.intervals, {'mlb': 60, 'nfl': 1800})
+
+    def test_failed_league_is_retried_soon(self):
+        self.poller.schedule('nfl', [], 0)
+        self.assertEqual(self.poller.schedule_retry('nfl', [], 100), 60)
+        self.assertEqual(self.poller.due(160), ['mlb', 'nfl'])
+        # A retry doesn't change the interval the league is polled at
+        self.assertEqual(self.poller.intervals, {'nfl': 1800})
+
+
+if __name__ == '__main__':
+    unittest.main()
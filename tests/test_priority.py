@@ -0,0 +1,69 @@
+import unittest
+
+from config import PRIORITY_TEAMS
+from priority import PriorityMatcher
+
+RAZORBACKS = {'id': '8', 'abbreviation': 'ARK', 'displayName': 'Arkansas Razorbacks',
+              'shortDisplayName': 'Arkansas', 'name': 'Razorbacks', 'location': 'Arkansas'}
+RED_WOLVES = {'id': '2032', 'abbreviation': 'ARST', 'displayName': 'Arkansas State Red Wolves',
+              'shortDisplayName': 'Arkansas St', 'name': 'Red Wolves', 'location': 'Arkansas State'}
+ASTROS = {'id': '18', 'abbreviation': 'HOU', 'displayName': 'Houston Astros',
+          'shortDisplayName': 'Astros', 'name': 'Astros', 'location': 'Houston'}
+TEXANS = {'id': '34', 'abbreviation': 'HOU', 'displayName': 'Houston Texans',
+          'shortDisplayName': 'Texans', 'name': 'Texans', 'location': 'Houston'}
+
+
+class PriorityMatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.matcher = PriorityMatcher(PRIORITY_TEAMS)
+
+    def test_exact_matches(self):
+        self.assertTrue(self.matcher.matches('college-football', RAZORBACKS))
+        self.assertTrue(self.matcher.matches('mlb', ASTROS))
+
+    def test_no_substring_matches(self):
+        # 'Arkansas' is a priority name, 'Arkansas State' only contains it
+        self.assertFalse(self.matcher.matches('college-football', RED_WOLVES))
+
+    def test_each_field_matches_alone(self):
+        matcher = PriorityMatcher({'mlb': ['houston astros']})
+        self.assertTrue(matcher.check('mlb', {'displayName': 'Houston Astros'}))
+        matcher = PriorityMatcher({'mlb': [18]})
+        self.assertTrue(matcher.check('mlb', {'id': '18'}))
+        self.assertFalse(matcher.check('mlb', {'abbreviation': '18x'}))
+
+    def test_matching_is_per_league(self):
+        # The Texans share HOU with the Astros, but the NFL has no priority teams
+        self.assertFalse(self.matcher.matches('nfl', TEXANS))
+        self.assertFalse(self.matcher.matches('mens-college-basketball', ASTROS))
+
+    def test_answers_are_cached_by_id(self):
+        self.assertFalse(self.matcher.matches('college-football', RED_WOLVES))
+        self.assertTrue(self.matcher.matches('college-football', RAZORBACKS))
+        self.assertEqual(self.matcher.by_id, {('college-football', '2032'): False,
+                                              ('college-football', '8'): True})
+        # A cached False is used as is, not checked again
+        renamed = dict(RED_WOLVES, location='Arkansas')
+        self.assertFalse(self.matcher.matches('college-football', renamed))
+        self.assertTrue(self.matcher.check('college-football', renamed))
+
+    def test_teams_without_an_id_are_not_cached(self):
+        team = {'abbreviation': 'ARK'}
+        self.assertTrue(self.matcher.matches('college-football', team))
+        self.assertEqual(self.matcher.by_id, {})
+
+    def test_patterns(self):
+        matcher = PriorityMatcher({}, {'nfl': [r'^houston ']})
+        self.assertTrue(matcher.matches('nfl', TEXANS))
+        self.assertFalse(matcher.matches('mlb', ASTROS))
+        self.assertFalse(matcher.matches('nfl', RED_WOLVES))
+
+    def test_patterns_add_to_exact_names(self):
+        matcher = PriorityMatcher({'college-football': ['ARK']},
+                                  {'college-football': [r'State']})
+        self.assertTrue(matcher.matches('college-football', RAZORBACKS))
+        self.assertTrue(matcher.matches('college-football', RED_WOLVES))
+
+
+if __name__ == '__main__':
+    unittest.main()
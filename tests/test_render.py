@@ -0,0 +1,185 @@
+import os
+import tempfile
+import unittest
+
+import headless
+from game_store import Game
+from layout import Layout
+
+try:
+    import sports_display
+except ImportError:
+    # requests isn't installed
+    sports_display = None
+
+
+def game(game_id='1', away_score=3, home_score=2, status='Top 7th', is_priority=False,
+         league='MLB'):
+    return Game(game_id, league, 'mlb', 'HOU', 'NYY', away_score, home_score, status, 'in',
+                is_priority)
+
+
+def tall_bdf():
+    """A BDF font 13 rows tall, so every line of a tile overlaps the next
+
+    Each character gets its own bitmap so that changed text changes pixels.
+    """
+    lines = ['STARTFONT 2.1', 'FONTBOUNDINGBOX 6 13 0 -2', 'CHARS 95']
+    for codepoint in range(32, 127):
+        lines += [f'STARTCHAR c{codepoint}', f'ENCODING {codepoint}', 'DWIDTH 6 0',
+                  'BBX 5 12 0 -2', 'BITMAP']
+        lines += [f'{(codepoint * (row + 3)) & 0x1f:02X}' for row in range(12)]
+        lines.append('ENDCHAR')
+    lines.append('ENDFONT')
+    return '\n'.join(lines) + '\n'
+
+
+@unittest.skipIf(sports_display is None, 'needs requests')
+class RenderTest(unittest.TestCase):
+    def setUp(self):
+        self.display = sports_display.SportsScoreDisplay(backend='headless')
+        self.display.score_cache_path = None
+
+    def tearDown(self):
+        self.display.executor.shutdown(wait=False)
+
+    def full_render(self, games):
+        """A page drawn from scratch, as its pixels"""
+        canvas = self.display.matrix.CreateFrameCanvas()
+        for page_game, tile in zip(games, self.display.layout.tiles):
+            self.display.render_game(canvas, page_game, tile, self.display.stale_age(page_game))
+        return bytes(canvas.pixels)
+
+    def front(self):
+        return bytes(self.display.matrix.front.pixels)
+
+    def assert_redraw_matches(self, before, after):
+        """Redrawing a cached page in place gives the same pixels as a full render"""
+        other = [game('9', 0, 0)]
+        self.display.draw_games(before)
+        # Put another page up, so the cached page is off screen and redrawn in place
+        self.display.draw_games(other)
+        cached = self.display.frame_cache.get(tuple(('mlb', g.id) for g in before)).canvas
+        self.display.draw_games(after)
+        self.assertIs(self.display.matrix.front, cached)
+        width = self.display.matrix.width
+        redrawn, expected = self.front(), self.full_render(after)
+        differing = sorted({(i // 3 % width, i // 3 // width) for i in range(len(expected))
+                            if redrawn[i] != expected[i]})
+        self.assertEqual(differing, [], 'pixels (x, y) that differ from a full render')
+
+    def test_draw_game(self):
+        self.display.draw_game(game())
+        self.assertEqual(self.front(), self.full_render([game()]))
+
+    def test_draw_games_fills_every_tile(self):
+        page = [game(str(i), away_score=i) for i in range(self.display.layout.games_per_frame)]
+        self.display.draw_games(page)
+        self.assertEqual(self.front(), self.full_render(page))
+
+    def test_unchanged_page_on_screen_is_left_alone(self):
+        self.display.draw_games([game()])
+        swaps = self.display.matrix.swaps
+        self.display.draw_games([game()])
+        self.assertEqual(self.display.matrix.swaps, swaps)
+
+    def test_cached_page_comes_back(self):
+        self.display.draw_games([game()])
+        cached = self.display.matrix.front
+        self.display.draw_games([game('2')])
+        self.display.draw_games([game()])
+        self.assertIs(self.display.matrix.front, cached)
+        self.assertEqual(self.front(), self.full_render([game()]))
+
+    def test_never_draws_on_the_screen(self):
+        self.display.draw_games([game()])
+        shown = self.display.matrix.front
+        pixels = bytes(shown.pixels)
+        self.display.draw_games([game(away_score=9)])
+        self.assertIsNot(self.display.matrix.front, shown)
+        self.assertEqual(bytes(shown.pixels), pixels)
+        self.assertEqual(self.front(), self.full_render([game(away_score=9)]))
+
+    def test_draw_no_games(self):
+        self.display.draw_no_games()
+        self.assertTrue(any(self.front()))
+
+    def test_score_change(self):
+        self.assert_redraw_matches([game()], [game(away_score=4)])
+
+    def test_wider_score(self):
+        self.assert_redraw_matches([game(home_score=9)], [game(home_score=10)])
+
+    def test_status_change(self):
+        self.assert_redraw_matches([game()], [game(status='Final')])
+
+    def test_priority_change(self):
+        self.assert_redraw_matches([game()], [game(is_priority=True)])
+
+    def test_everything_changes(self):
+        self.assert_redraw_matches([game(), game('2')],
+                                   [game(away_score=5, status='Mid 8th', league='NCAA'),
+                                    game('2', home_score=7, is_priority=True)])
+
+    def test_stale_age_change(self):
+        self.display.snapshot = self.display.snapshot._replace(stale={'mlb': 0})
+        self.assert_redraw_matches([game()], [game(status='Final')])
+
+
+    def test_score_flash_stays_behind_the_scores(self):
+        display = self.display
+        shown = game(status='Bot 7th', home_score=10)
+        tile = display.layout.tiles[0]
+        normal = self.full_render([shown])
+        canvas = display.matrix.CreateFrameCanvas()
+        canvas.pixels[:] = normal
+        display.draw_score_flash(canvas, shown, tile)
+        flashed = bytes(canvas.pixels)
+
+        rows, x_start, x_end = display.part_boxes(tile)['scores']
+        width = display.matrix.width
+        yellow = 0
+        for i in range(0, len(normal), 3):
+            x, y = i // 3 % width, i // 3 // width
+            if flashed[i:i + 3] == normal[i:i + 3]:
+                continue
+            self.assertTrue(rows[0] <= y <= rows[1] and x_start <= x <= x_end, (x, y))
+            if flashed[i:i + 3] == b'\xff\xff\x00':
+                self.assertTrue(display.layout.score_block_rows[0] <= y <=
+                                display.layout.score_block_rows[1], (x, y))
+                yellow += 1
+        self.assertGreater(yellow, 0)
+
+        # The status line is untouched
+        status = display.matrix.CreateFrameCanvas()
+        display.draw_status(status, shown, tile)
+        for i in range(0, len(normal), 3):
+            if status.pixels[i:i + 3] != b'\x00\x00\x00':
+                self.assertEqual(flashed[i:i + 3], normal[i:i + 3])
+
+
+class TallFontRenderTest(RenderTest):
+    """The same redraws with lines that overlap each other"""
+
+    def setUp(self):
+        super().setUp()
+        with tempfile.NamedTemporaryFile('w', suffix='.bdf', delete=False) as f:
+            f.write(tall_bdf())
+        self.addCleanup(os.remove, f.name)
+        display = self.display
+        display.font_large = headless.Font()
+        display.font_large.LoadFont(f.name)
+        display.font_small = display.font_large
+        display.layout = Layout(display.matrix.width, display.matrix.height,
+                                display.font_large, display.font_small)
+
+    def test_lines_overlap(self):
+        layout = self.display.layout
+        self.assertEqual(layout.header_rows, (0, 9))
+        self.assertEqual(layout.score_rows, (6, 26))
+        self.assertEqual(layout.status_rows, (21, 31))
+        self.assertEqual(layout.score_block_rows, (10, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+from resilience import CircuitBreaker, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_steady_rate(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=0.5, capacity=3, clock=clock)
+        self.assertEqual([bucket.try_acquire() for _ in range(4)], [True, True, True, False])
+        clock.now += 1
+        self.assertFalse(bucket.try_acquire())
+        clock.now += 1
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_refill_is_capped(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+        clock.now += 100
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [True, True, False])
+
+
+# No jitter, so backoff delays are exact
+@mock.patch('resilience.random.uniform', lambda low, high: high)
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.breaker = CircuitBreaker(threshold=3, base_delay=10, max_delay=60, clock=self.clock)
+
+    def fail(self, times, retry_after=0):
+        return [self.breaker.record_failure(retry_after) for _ in range(times)]
+
+    def test_stays_closed_below_threshold(self):
+        self.assertEqual(self.fail(2), [None, None])
+        self.assertEqual(self.breaker.failures, 2)
+        self.assertFalse(self.breaker.is_open)
+        self.assertTrue(self.breaker.allow())
+
+    def test_opens_at_threshold(self):
+        self.assertEqual(self.fail(3), [None, None, 10])
+        self.assertTrue(self.breaker.is_open)
+        self.assertFalse(self.breaker.allow())
+        self.clock.now += 9.9
+        self.assertFalse(self.breaker.allow())
+
+    def test_one_trial_when_backoff_is_over(self):
+        self.fail(3)
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+    def test_trial_success_closes(self):
+        self.fail(3)
+        self.clock.now += 10
+        self.breaker.allow()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.failures, 0)
+        self.assertFalse(self.breaker.is_open)
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_trial_failure_doubles_backoff_up_to_max(self):
+        self.fail(3)
+        delays = []
+        for _ in range(4):
+            self.clock.now += 100
+            self.assertTrue(self.breaker.allow())
+            delays.append(self.breaker.record_failure())
+        self.assertEqual(delays, [20, 40, 60, 60])
+
+    def test_retry_after_wins_when_longer(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.record_failure(retry_after=45), 45)
+        self.clock.now += 44
+        self.assertFalse(self.breaker.allow())
+        self.clock.now += 1
+        self.assertTrue(self.breaker.allow())
+
+    def test_retry_after_ignored_when_shorter(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.record_failure(retry_after=1), 10)
+
+
+class CircuitBreakerJitterTest(unittest.TestCase):
+    def test_jitter_stays_within_half_to_full_backoff(self):
+        breaker = CircuitBreaker(threshold=1, base_delay=10, max_delay=60, clock=Clock())
+        for _ in range(20):
+            breaker.failures = 0
+            self.assertTrue(5 <= breaker.record_failure() <= 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
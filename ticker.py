@@ -0,0 +1,178 @@
+"""
+Scrolling ticker for the Sports Score Display
+Pre-renders games into a wide image strip so each frame is just a crop and a copy
+"""
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageOps
+except ImportError:
+    Image = None
+
+from game_store import game_key
+
+TILE_PADDING = 4
+SEPARATOR_COLOR = (40, 40, 40)
+LEAGUE_COLOR = (0, 150, 255)
+PRIORITY_COLOR = (255, 0, 255)
+STATUS_COLOR = (255, 255, 0)
+LEADER_COLOR = (0, 255, 0)
+AGE_COLOR = (255, 165, 0)
+WHITE = (255, 255, 255)
+
+
+class TickerRenderer:
+    """Draws games as tiles laid out like draw_game, using PIL
+
+    The LED matrix can't draw text into an off-screen buffer, so the strip
+    is rendered with PIL from the TrueType fonts in config.py. Canvases take
+    PIL images through SetImage.
+    """
+
+    def __init__(self, height, font_large, font_small, large_size, small_size, team_color):
+        self.height = height
+        self.font_large = ImageFont.truetype(font_large, large_size)
+        self.font_small = ImageFont.truetype(font_small, small_size)
+        # team_color(league_key, abbreviation) -> (r, g, b) or None
+        self.team_color = team_color
+
+    def text_width(self, text, font):
+        return int(font.getlength(text))
+
+    def tile_width(self, game, age=None):
+        """Width a game needs, wide enough for its longest line"""
+        status = game.status + ' ' + age if age else game.status
+        team_width = max(self.text_width(game.away_team, self.font_large),
+                         self.text_width(game.home_team, self.font_large))
+        score_width = max(self.text_width(str(game.away_score), self.font_large),
+                          self.text_width(str(game.home_score), self.font_large))
+        return 2 + max(team_width + TILE_PADDING + score_width,
+                       self.text_width(game.league + ' ★', self.font_small),
+                       self.text_width(status, self.font_small)) + TILE_PADDING
+
+    def draw_tile(self, image, game, x, width=None, age=None):
+        """Draw one game with its left edge at x, clipped to width if given
+
+        age is shown after the status when the scores are stale.
+        """
+        if width is None:
+            width = self.tile_width(game, age)
+        tile = Image.new('RGB', (width, self.height))
+        draw = ImageDraw.Draw(tile)
+        # Crisp pixels, antialiasing just blurs 7px text on an LED panel
+        draw.fontmode = '1'
+
+        league_color = PRIORITY_COLOR if game.is_priority else LEAGUE_COLOR
+        draw.text((2, 8), game.league, font=self.font_small, fill=league_color, anchor='ls')
+        if game.is_priority:
+            league_width = self.text_width(game.league + ' ', self.font_small)
+            draw.text((2 + league_width, 8), '★', font=self.font_small, fill=STATUS_COLOR, anchor='ls')
+
+        team_width = max(self.text_width(game.away_team, self.font_large),
+                         self.text_width(game.home_team, self.font_large))
+        score_x = 2 + team_width + TILE_PADDING
+        for team, score, other_score, baseline in ((game.away_team, game.away_score, game.home_score, 17),
+                                                   (game.home_team, game.home_score, game.away_score, 25)):
+            color = self.team_color(game.league_key, team) or WHITE
+            draw.text((2, baseline), team, font=self.font_large, fill=color, anchor='ls')
+            score_color = LEADER_COLOR if score > other_score else WHITE
+            draw.text((score_x, baseline), str(score), font=self.font_large, fill=score_color,
+                      anchor='ls')
+
+        draw.text((2, 32), game.status, font=self.font_small, fill=STATUS_COLOR, anchor='ls')
+        if age:
+            age_x = 2 + self.text_width(game.status + ' ', self.font_small)
+            draw.text((age_x, 32), age, font=self.font_small, fill=AGE_COLOR, anchor='ls')
+        draw.line((width - 1, 0, width - 1, self.height - 1), fill=SEPARATOR_COLOR)
+        image.paste(tile, (x, 0))
+        return width
+
+    def flash(self, panel):
+        """A panel with its colors inverted, to draw the eye to a new score"""
+        return ImageOps.invert(panel)
+
+    def render_panel(self, game, width, age=None):
+        """A single game as a fixed-width image, for the pinned panel"""
+        panel = Image.new('RGB', (width, self.height))
+        self.draw_tile(panel, game, 0, width, age)
+        return panel
+
+
+class TickerStrip:
+    """The non-priority games rendered side by side into one wide image
+
+    The first window_width pixels are repeated after the content, so any
+    window starting inside the content can be cropped without wrapping.
+    """
+
+    def __init__(self, renderer, window_width):
+        self.renderer = renderer
+        self.window_width = window_width
+        self.games = ()
+        self.ages = ()
+        self.widths = []
+        self.image = None
+        self.content_width = 0
+
+    @property
+    def scrolls(self):
+        """False when everything fits in the window"""
+        return self.content_width > self.window_width
+
+    def update(self, games, ages=None):
+        """Render a new set of games, with an age label (or None) for each
+
+        If the same games are still there in the same order and every tile
+        keeps its width, only the tiles that changed are redrawn.
+        """
+        ages = tuple(ages or (None,) * len(games))
+        old_items = list(zip(self.games, self.ages))
+        items = list(zip(games, ages))
+        if len(items) == len(old_items):
+            widths = [width if old == new else self.renderer.tile_width(*new)
+                      for old, new, width in zip(old_items, items, self.widths)]
+        else:
+            widths = [self.renderer.tile_width(*item) for item in items]
+        same_layout = (self.image is not None and widths == self.widths and
+                       [game_key(game) for game in games] == [game_key(game) for game in self.games])
+        if not same_layout:
+            self.rebuild(games, ages, widths)
+            return
+
+        x = 0
+        for old, (game, age), width in zip(old_items, items, widths):
+            if old != (game, age):
+                self.renderer.draw_tile(self.image, game, x, width, age)
+                if self.scrolls and x < self.window_width:
+                    self.renderer.draw_tile(self.image, game, self.content_width + x, width, age)
+            x += width
+        self.games = games
+        self.ages = ages
+
+    def rebuild(self, games, ages, widths):
+        self.games = games
+        self.ages = ages
+        self.widths = widths
+        self.content_width = sum(widths)
+        height = self.renderer.height
+        self.image = Image.new('RGB', (self.content_width + self.window_width, height))
+
+        x = 0
+        for game, age, width in zip(games, ages, widths):
+            x += self.renderer.draw_tile(self.image, game, x, width, age)
+        if self.scrolls:
+            # Wrap the start of the content round to the end
+            self.image.paste(self.image.crop((0, 0, self.window_width, height)), (self.content_width, 0))
+
+    def position(self, key):
+        """Where the tile for a game_key starts, or None"""
+        x = 0
+        for game, width in zip(self.games, self.widths):
+            if game_key(game) == key:
+                return x
+            x += width
+        return None
+
+    def window(self, position):
+        """The window_width pixels starting at position, wrapping round"""
+        x = int(position) % self.content_width if self.scrolls else 0
+        return self.image.crop((x, 0, x + self.window_width, self.renderer.height))